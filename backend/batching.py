@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable
+
+from executors import WorkLane
+
+
+class _Group:
+    def __init__(self, context: Any):
+        self.context = context
+        self.items: list[Any] = []
+        self.futures: list[asyncio.Future] = []
+        self.submitted: list[float] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+# Coalesces concurrent single-item requests into one call of `runner(context, items)`.
+# The first request of a group opens a window of `window_ms`; the group is flushed when
+# the window closes or it reaches `max_batch` items, whichever is first. Requests are only
+# grouped with others sharing the same context object (the serving snapshot), so a batch
+# never mixes dataset versions. Everything but the runner happens on the event loop, so
+# the pending groups need no lock.
+class MicroBatcher:
+    def __init__(
+        self,
+        name: str,
+        runner: Callable[[Any, list[Any]], list[Any]],
+        lane: WorkLane,
+        window_ms: float,
+        max_batch: int,
+    ):
+        self.name = name
+        self.window = max(window_ms, 0.0) / 1000
+        self.max_batch = max(1, max_batch)
+        self._runner = runner
+        self._lane = lane
+        self._pending: dict[int, _Group] = {}
+        self._running: set[asyncio.Task] = set()
+        self._batches = 0
+        self._items = 0
+        self._full = 0
+        self._max_size = 0
+        self._sizes: dict[int, int] = {}
+        self._delay_total = 0.0
+        self._delay_max = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    async def submit(self, context: Any, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        key = id(context)
+        group = self._pending.get(key)
+        if group is None:
+            group = self._pending[key] = _Group(context)
+            group.timer = loop.call_later(self.window, self._flush, key, False)
+
+        future = loop.create_future()
+        group.items.append(item)
+        group.futures.append(future)
+        group.submitted.append(time.perf_counter())
+        if len(group.items) >= self.max_batch:
+            group.timer.cancel()
+            self._flush(key, True)
+        return await future
+
+    def _flush(self, key: int, full: bool) -> None:
+        group = self._pending.pop(key, None)
+        if group is None:
+            return
+        now = time.perf_counter()
+        size = len(group.items)
+        self._batches += 1
+        self._items += size
+        self._full += full
+        self._max_size = max(self._max_size, size)
+        # Power-of-two buckets: 1, 2-3, 4-7, ...
+        bucket = 1 << (size.bit_length() - 1)
+        self._sizes[bucket] = self._sizes.get(bucket, 0) + 1
+        for submitted in group.submitted:
+            self._delay_total += now - submitted
+            self._delay_max = max(self._delay_max, now - submitted)
+
+        task = asyncio.ensure_future(self._run(group))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, group: _Group) -> None:
+        try:
+            results = await self._lane.run(self._runner, group.context, group.items)
+        except Exception as exc:
+            for future in group.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future, result in zip(group.futures, results):
+            # A caller that went away has a cancelled future.
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "batches": self._batches,
+            "requests": self._items,
+            "flushed_full": self._full,
+            "avg_batch_size": round(self._items / self._batches, 3) if self._batches else 0.0,
+            "max_batch_size": self._max_size,
+            "batch_sizes": {
+                (str(b) if b == 1 else f"{b}-{2 * b - 1}"): n for b, n in sorted(self._sizes.items())
+            },
+            "avg_queue_delay_ms": round(self._delay_total / self._items * 1000, 3) if self._items else 0.0,
+            "max_queue_delay_ms": round(self._delay_max * 1000, 3),
+        }
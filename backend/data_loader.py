@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from io import BytesIO
+import os
+import time
 from pathlib import Path
 from typing import Any
 
@@ -7,9 +10,30 @@ import joblib
 import numpy as np
 import pandas as pd
 
+from dataset_cache import bytes_digest, read_cached_frame, scored_dataset_key, write_cached_frame
+from feature_stats import CONTRIBUTION_PREFIX, FeatureIndex, FeatureStats, build_feature_stats
+from forest import ROW_BLOCK, PackedForest, tree_spread
+from frontier import OBJECTIVES, frontier_layers
+from goal_seek import seek_target
+from insights import InsightColumns
+from name_index import NameIndex
+from pagination import InvalidCursor, decode_cursor, encode_cursor
+from scoring import ScoreMatrix
+from similarity import SimilarityIndex
+from suburb_store import SuburbStore, roi_threshold
+
 ROOT_DIR = Path(__file__).resolve().parent.parent
 CSV_PATH = ROOT_DIR / "prepared_data" / "suburb_roi_features.csv"
 MODEL_PATH = ROOT_DIR / "models" / "roi_model.pkl"
+SCORED_CACHE_PATH = ROOT_DIR / "models" / "scored_dataset.npz"
+
+# "packed" serves small batches from PackedForest; "sklearn" always calls model.predict.
+FOREST_ENGINE = os.environ.get("ROI_FOREST_ENGINE", "packed").lower()
+PACKED_MAX_ROWS = 256
+INTERVAL_COLUMNS = ["roi_p10", "roi_p50", "roi_p90", "roi_std"]
+SWEEP_MAX_POINTS = 100
+GOAL_SEEK_BUDGET_MS = 500.0
+GOAL_SEEK_MAX_BUDGET_MS = 2000.0
 
 
 def _safe_numeric(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
@@ -23,19 +47,74 @@ def load_model_artifact() -> dict[str, Any] | None:
     if not MODEL_PATH.exists():
         return None
 
-    artifact = joblib.load(MODEL_PATH)
+    # Digest the same bytes that are unpickled, so a file replaced mid-load cannot pair
+    # one model with another's digest.
+    raw = MODEL_PATH.read_bytes()
+    artifact = joblib.load(BytesIO(raw))
     if not isinstance(artifact, dict):
         return None
     if "model" not in artifact or "features" not in artifact:
         return None
+    artifact["digest"] = bytes_digest(raw)
+    # feature_importances_ is recomputed from every tree on each access; read it once.
+    importances = getattr(artifact["model"], "feature_importances_", None)
+    if importances is not None:
+        artifact["feature_importances"] = np.array(importances, dtype=float)
+    # Per-tree outputs for prediction intervals always come from the packed arrays; the
+    # engine setting only decides who computes the point prediction.
+    artifact["forest_trees"] = PackedForest.from_model(artifact["model"])
+    if FOREST_ENGINE == "packed":
+        artifact["packed_forest"] = artifact["forest_trees"]
     return artifact
 
 
-def load_dataset(artifact: dict[str, Any] | None = None) -> pd.DataFrame:
+def model_predict(artifact: dict[str, Any], model_input: pd.DataFrame) -> np.ndarray:
+    packed = artifact.get("packed_forest")
+    if packed is not None and len(model_input) <= PACKED_MAX_ROWS:
+        return packed.predict(model_input.to_numpy(dtype=float))
+    return np.asarray(artifact["model"].predict(model_input), dtype=float)
+
+
+def model_predict_spread(artifact: dict[str, Any], model_input: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    # Point predictions plus the (rows, 4) P10/P50/P90/std spread across the trees. Every
+    # tree is evaluated in one stacked pass over the packed node arrays, and with the packed
+    # engine the point value is the (bit-identical) mean of those same outputs, at any batch
+    # size. Only ROI_FOREST_ENGINE=sklearn pays for a second, sklearn pass.
+    trees = artifact.get("forest_trees")
+    if trees is None:
+        roi = model_predict(artifact, model_input)
+        return roi, np.column_stack([roi, roi, roi, np.zeros(len(roi))])
+    X = model_input.to_numpy(dtype=float)
+    packed = artifact.get("packed_forest") is not None
+    roi = np.empty(len(X), dtype=float)
+    spread = np.empty((len(X), 4), dtype=float)
+    for start in range(0, len(X), ROW_BLOCK):
+        per_tree = trees.tree_predictions(X[start : start + ROW_BLOCK])
+        if packed:
+            roi[start : start + ROW_BLOCK] = trees.mean(per_tree)
+        spread[start : start + ROW_BLOCK] = tree_spread(per_tree)
+    if not packed:
+        roi = model_predict(artifact, model_input)
+    return roi, spread
+
+
+def load_dataset(artifact: dict[str, Any] | None = None) -> tuple[pd.DataFrame, str]:
+    # Returns the frame and the SHA-256 of the CSV bytes it was parsed from.
     if not CSV_PATH.exists():
         raise FileNotFoundError(f"CSV file not found at {CSV_PATH}")
+    raw = CSV_PATH.read_bytes()
+    csv_digest = bytes_digest(raw)
+
+    # Scoring every suburb with the forest dominates cold start, so reuse the scored frame
+    # while neither the CSV nor the model artifact has changed.
+    cache_key = None
+    if artifact and artifact.get("digest"):
+        cache_key = scored_dataset_key(csv_digest, artifact["digest"])
+        cached = read_cached_frame(SCORED_CACHE_PATH, cache_key)
+        if cached is not None:
+            return cached, csv_digest
 
-    df = pd.read_csv(CSV_PATH)
+    df = pd.read_csv(BytesIO(raw))
 
     if artifact:
         features = [f for f in artifact.get("features", []) if f in df.columns]
@@ -43,10 +122,20 @@ def load_dataset(artifact: dict[str, Any] | None = None) -> pd.DataFrame:
         model_input = df[features].copy()
         model_input = model_input.replace([np.inf, -np.inf], np.nan)
         model_input = model_input.fillna(model_input.median(numeric_only=True)).fillna(0)
-        df["roi"] = artifact["model"].predict(model_input)
+        df["roi"], spread = model_predict_spread(artifact, model_input)
+        for j, column in enumerate(INTERVAL_COLUMNS):
+            df[column] = spread[:, j]
+        trees = artifact.get("forest_trees")
+        if trees is not None:
+            contributions = trees.contributions(model_input.to_numpy(dtype=float))
+            for j, feature in enumerate(features):
+                df[CONTRIBUTION_PREFIX + feature] = contributions[:, j]
     else:
         fallback_target = "Realistic_ROI_Target" if "Realistic_ROI_Target" in df.columns else "ROI_Proxy_Score"
         df["roi"] = pd.to_numeric(df.get(fallback_target, 0), errors="coerce").fillna(0)
+        for column in INTERVAL_COLUMNS[:3]:
+            df[column] = df["roi"]
+        df["roi_std"] = 0.0
 
     if "SAL_NAME_2021" in df.columns:
         df["name"] = df["SAL_NAME_2021"]
@@ -64,23 +153,22 @@ def load_dataset(artifact: dict[str, Any] | None = None) -> pd.DataFrame:
     if "Top20_Flag" not in df.columns:
         df["Top20_Flag"] = 0
 
-    return df.replace([np.inf, -np.inf], np.nan)
+    df = df.replace([np.inf, -np.inf], np.nan)
+    if cache_key:
+        write_cached_frame(SCORED_CACHE_PATH, cache_key, df)
+    return df, csv_digest
 
 
-def dataset_to_api_rows(df: pd.DataFrame) -> list[dict[str, Any]]:
-    output_cols = [
-        "name",
-        "roi",
-        "price",
-        "rent",
-        "seifa_score",
-        "yield_pct",
-        "growth_pct",
-        "Top20_Flag",
-    ]
-    existing = [c for c in output_cols if c in df.columns]
-    data = df[existing].copy().fillna(0)
-    return data.to_dict(orient="records")
+def dataset_to_store(df: pd.DataFrame, name_index: NameIndex | None = None) -> SuburbStore:
+    return SuburbStore.from_dataframe(df, name_index)
+
+
+def _safe_range(low: float, q1: float, q3: float, high: float) -> tuple[float, float]:
+    # Observed range clipped to the 1.5 * IQR fences.
+    iqr = q3 - q1
+    if iqr > 0:
+        return max(low, q1 - 1.5 * iqr), min(high, q3 + 1.5 * iqr)
+    return low, high
 
 
 def get_feature_metadata(df: pd.DataFrame, model_features: list[str]) -> list[dict[str, Any]]:
@@ -91,11 +179,9 @@ def get_feature_metadata(df: pd.DataFrame, model_features: list[str]) -> list[di
         s = pd.to_numeric(df[feature], errors="coerce").replace([np.inf, -np.inf], np.nan)
         if s.dropna().empty:
             continue
-        q1 = float(s.quantile(0.25))
-        q3 = float(s.quantile(0.75))
-        iqr = q3 - q1
-        safe_min = float(max(s.min(), q1 - 1.5 * iqr)) if iqr > 0 else float(s.min())
-        safe_max = float(min(s.max(), q3 + 1.5 * iqr)) if iqr > 0 else float(s.max())
+        safe_min, safe_max = _safe_range(
+            float(s.min()), float(s.quantile(0.25)), float(s.quantile(0.75)), float(s.max())
+        )
         meta.append(
             {
                 "feature": feature,
@@ -155,263 +241,450 @@ def user_input_guidance(df: pd.DataFrame) -> dict[str, Any]:
     return guidance
 
 
-def _build_base_feature_vector(
-    df: pd.DataFrame,
-    model_features: list[str],
-    suburb_name: str | None,
-) -> dict[str, float]:
-    if suburb_name:
-        matched = df[df["name"].str.lower() == suburb_name.lower()]
-        if not matched.empty:
-            row = matched.iloc[0]
-            result: dict[str, float] = {}
-            for f in model_features:
-                val = pd.to_numeric(row.get(f), errors="coerce")
-                if pd.isna(val):
-                    val = pd.to_numeric(df[f], errors="coerce").median()
-                result[f] = float(val)
-            return result
-
-    result = {}
-    for f in model_features:
-        s = pd.to_numeric(df[f], errors="coerce")
-        result[f] = float(s.median())
-    return result
+def _build_input_matrix(index: FeatureIndex, items: list[dict[str, Any]]) -> np.ndarray:
+    positions = {f: j for j, f in enumerate(index.features)}
+    matrix = np.empty((len(items), len(index.features)), dtype=float)
+    for i, item in enumerate(items):
+        row = index.row_index(item.get("suburb_name"), item.get("sal_code"))
+        matrix[i] = index.medians if row is None else index.matrix[row]
+        for key, value in (item.get("feature_values") or {}).items():
+            j = positions.get(key)
+            if j is not None and value is not None:
+                matrix[i, j] = float(value)
+    return matrix
 
 
-def predict_from_inputs(
+def _investment_signal(percentile: float) -> str:
+    if percentile >= 80:
+        return "Strong"
+    if percentile <= 40:
+        return "Cautious"
+    return "Moderate"
+
+
+def _path_contributions(
+    artifact: dict[str, Any],
+    index: FeatureIndex,
+    items: list[dict[str, Any]],
+    base: np.ndarray,
+    model_input: pd.DataFrame,
+) -> np.ndarray | None:
+    # Exact per-feature contributions for each item. A known suburb whose inputs were not
+    # changed reuses the contributions precomputed with the scored dataset; only items with
+    # overridden values (or no suburb) walk the trees.
+    trees = artifact.get("forest_trees")
+    if trees is None:
+        return None
+    reuse = np.zeros(len(items), dtype=bool)
+    rows = np.zeros(len(items), dtype=np.intp)
+    if index.contributions is not None:
+        for i, item in enumerate(items):
+            row = index.row_index(item.get("suburb_name"), item.get("sal_code"))
+            if row is not None and np.array_equal(base[i], index.matrix[row]):
+                reuse[i], rows[i] = True, row
+
+    out = np.empty((len(items), base.shape[1]), dtype=float)
+    if reuse.any():
+        out[reuse] = index.contributions[rows[reuse]]
+    walk = np.flatnonzero(~reuse)
+    if len(walk):
+        out[walk] = trees.contributions(model_input.to_numpy(dtype=float)[walk])
+    return out
+
+
+def predict_batch(
     df: pd.DataFrame,
     artifact: dict[str, Any],
-    suburb_name: str | None,
-    feature_values: dict[str, float] | None,
-) -> dict[str, Any]:
+    items: list[dict[str, Any]],
+    stats: FeatureStats | None = None,
+    index: FeatureIndex | None = None,
+) -> list[dict[str, Any]]:
     model = artifact["model"]
     model_features = [f for f in artifact.get("features", []) if f in df.columns]
     if not model_features:
         raise ValueError("No usable model features are available in prepared data.")
+    if stats is None:
+        stats = build_feature_stats(df, model_features)
+    if index is None:
+        index = FeatureIndex(df, stats)
+    if not items:
+        return []
 
-    base = _build_base_feature_vector(df, model_features, suburb_name)
-    feature_values = feature_values or {}
-
-    for key, value in feature_values.items():
-        if key in base and value is not None:
-            base[key] = float(value)
-
-    model_input = pd.DataFrame([base], columns=model_features)
+    base = _build_input_matrix(index, items)
+    model_input = pd.DataFrame(base, columns=model_features)
     model_input = model_input.replace([np.inf, -np.inf], np.nan).fillna(0)
 
-    roi_score = float(model.predict(model_input)[0])
-    historical = pd.to_numeric(df["roi"], errors="coerce").dropna()
-    percentile = 0.0
-    if not historical.empty:
-        percentile = float((historical <= roi_score).mean() * 100)
-
-    # Lightweight interpretability for POC: combine feature importance with normalized delta.
-    medians = {f: float(pd.to_numeric(df[f], errors="coerce").median()) for f in model_features}
-    stds = {
-        f: float(pd.to_numeric(df[f], errors="coerce").std())
-        for f in model_features
-    }
-
-    importances = getattr(model, "feature_importances_", np.ones(len(model_features)))
-    importances = np.array(importances, dtype=float)
-
-    contributions = []
-    for idx, f in enumerate(model_features):
-        denom = stds[f] if stds[f] and stds[f] > 0 else 1.0
-        delta = (base[f] - medians[f]) / denom
-        score = float(importances[idx] * delta)
-        direction = "positive" if score >= 0 else "negative"
-        contributions.append(
+    roi_scores, spread = model_predict_spread(artifact, model_input)
+    percentiles = stats.roi_percentiles(roi_scores)
+
+    medians = np.array([stats.medians[f] for f in model_features], dtype=float)
+    impact = _path_contributions(artifact, index, items, base, model_input)
+    if impact is None:
+        # No packed trees to walk: fall back to importance times the normalized delta.
+        stds = np.array([stats.stds[f] for f in model_features], dtype=float)
+        denoms = np.where(stds > 0, stds, 1.0)
+        importances = artifact.get("feature_importances")
+        if importances is None:
+            importances = getattr(model, "feature_importances_", np.ones(len(model_features)))
+        importances = np.array(importances, dtype=float)[: len(model_features)]
+        impact = importances * ((base - medians) / denoms)
+    ranked = np.argsort(-np.abs(np.round(impact, 6)), axis=1, kind="stable")[:, :5]
+
+    results: list[dict[str, Any]] = []
+    for i, item in enumerate(items):
+        values = base[i].tolist()
+        top_factors = [
+            {
+                "feature": model_features[j],
+                "value": round(values[j], 4),
+                "median": round(float(medians[j]), 4),
+                "effect": "positive" if impact[i, j] >= 0 else "negative",
+                "impact_score": round(float(impact[i, j]), 6),
+            }
+            for j in ranked[i].tolist()
+        ]
+        roi_score = float(roi_scores[i])
+        percentile = float(percentiles[i])
+        p10, p50, p90, std = spread[i].tolist()
+        results.append(
             {
-                "feature": f,
-                "value": round(base[f], 4),
-                "median": round(medians[f], 4),
-                "effect": direction,
-                "impact_score": round(score, 4),
+                "suburb_name": item.get("suburb_name"),
+                "predicted_roi_score": round(roi_score, 6),
+                "predicted_roi_percent": round(roi_score * 100, 2),
+                "percentile_vs_all_suburbs": round(percentile, 2),
+                "investment_signal": _investment_signal(percentile),
+                "prediction_interval": {
+                    "p10": round(p10, 6),
+                    "p50": round(p50, 6),
+                    "p90": round(p90, 6),
+                    "std": round(std, 6),
+                },
+                "input_features": {f: round(v, 4) for f, v in zip(model_features, values)},
+                "top_factors": top_factors,
             }
         )
+    return results
 
-    top_factors = sorted(contributions, key=lambda x: abs(x["impact_score"]), reverse=True)[:5]
 
-    signal = "Moderate"
-    if percentile >= 80:
-        signal = "Strong"
-    elif percentile <= 40:
-        signal = "Cautious"
+def predict_from_inputs(
+    df: pd.DataFrame,
+    artifact: dict[str, Any],
+    suburb_name: str | None,
+    feature_values: dict[str, float] | None,
+    stats: FeatureStats | None = None,
+    index: FeatureIndex | None = None,
+    sal_code: str | None = None,
+) -> dict[str, Any]:
+    item = {"suburb_name": suburb_name, "sal_code": sal_code, "feature_values": feature_values}
+    return predict_batch(df, artifact, [item], stats=stats, index=index)[0]
+
+
+def sweep_axis(stats: FeatureStats, feature: str, points: int, bounds: tuple[float, float] | None = None) -> np.ndarray:
+    # Evenly spaced values, by default over the feature's 5-95% range as in user_input_guidance.
+    if bounds is None:
+        bounds = (stats.quantiles[feature][0.05], stats.quantiles[feature][0.95])
+    lo, hi = float(bounds[0]), float(bounds[1])
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        raise ValueError(f"No finite sweep range for {feature}.")
+    return np.linspace(lo, hi, points)
+
+
+def predict_sweep(
+    artifact: dict[str, Any],
+    stats: FeatureStats,
+    index: FeatureIndex,
+    features: list[str],
+    suburb_name: str | None = None,
+    sal_code: str | None = None,
+    feature_values: dict[str, float] | None = None,
+    points: int = 25,
+    ranges: dict[str, tuple[float, float]] | None = None,
+) -> dict[str, Any]:
+    # ROI over a grid of one or two features, everything else held at the baseline inputs.
+    # Every grid point is a row of one matrix, scored with a single model call.
+    if not 1 <= len(features) <= 2 or len(set(features)) != len(features):
+        raise ValueError("Sweep one or two distinct features.")
+    unknown = [f for f in features if f not in index.features]
+    if unknown:
+        raise ValueError(f"Unknown model features: {', '.join(unknown)}.")
+    ranges = ranges or {}
+    points = max(2, min(points, SWEEP_MAX_POINTS))
+
+    item = {"suburb_name": suburb_name, "sal_code": sal_code, "feature_values": feature_values}
+    baseline = np.nan_to_num(_build_input_matrix(index, [item])[0], nan=0.0, posinf=0.0, neginf=0.0)
+    axes = [sweep_axis(stats, f, points, ranges.get(f)) for f in features]
+    grid = np.meshgrid(*axes, indexing="ij")
+
+    # The untouched baseline rides along as the last row.
+    matrix = np.tile(baseline, (grid[0].size + 1, 1))
+    for f, values in zip(features, grid):
+        matrix[:-1, index.features.index(f)] = values.ravel()
+    roi = model_predict(artifact, pd.DataFrame(matrix, columns=list(index.features)))
+    baseline_roi = float(roi[-1])
+    roi = roi[:-1]
 
     return {
         "suburb_name": suburb_name,
-        "predicted_roi_score": round(roi_score, 6),
-        "predicted_roi_percent": round(roi_score * 100, 2),
-        "percentile_vs_all_suburbs": round(percentile, 2),
-        "investment_signal": signal,
-        "input_features": {k: round(v, 4) for k, v in base.items()},
-        "top_factors": top_factors,
+        "features": features,
+        "baseline": {f: round(float(baseline[index.features.index(f)]), 4) for f in features},
+        "baseline_roi_score": round(baseline_roi, 6),
+        "grid": {f: np.round(axis, 4).tolist() for f, axis in zip(features, axes)},
+        # 1-D: one value per grid point; 2-D: rows follow the first feature's grid.
+        "roi": np.round(roi.reshape(grid[0].shape), 6).tolist(),
     }
 
 
-def investment_opportunities(df: pd.DataFrame, top_n: int = 20) -> dict[str, Any]:
-    working = df.copy()
-    working = working.dropna(subset=["name", "roi"])
-    working = working.sort_values("roi", ascending=False)
-
-    top_n = max(5, min(top_n, 100))
-    top = working.head(top_n).copy()
-
-    rent_p75 = pd.to_numeric(working.get("rent", 0), errors="coerce").quantile(0.75)
-    seifa_p60 = pd.to_numeric(working.get("seifa_score", 0), errors="coerce").quantile(0.60)
-    mortgage_p40 = pd.to_numeric(working.get("price", 0), errors="coerce").quantile(0.40)
-
-    def tags(row: pd.Series) -> list[str]:
-        t: list[str] = []
-        if row.get("rent", 0) >= rent_p75:
-            t.append("High rent demand")
-        if row.get("seifa_score", 0) >= seifa_p60:
-            t.append("Socio-economic resilience")
-        if row.get("price", 0) <= mortgage_p40:
-            t.append("Relatively affordable")
-        if row.get("Top20_Flag", 0) == 1:
-            t.append("Top ROI cluster")
-        if not t:
-            t.append("Balanced profile")
-        return t
-
-    top["insight_tags"] = top.apply(tags, axis=1)
-
-    summary = {
-        "avg_roi_percent_top_n": round(float(top["roi"].mean() * 100), 2),
-        "median_roi_percent_all": round(float(working["roi"].median() * 100), 2),
-        "max_roi_percent": round(float(working["roi"].max() * 100), 2),
-        "suburbs_analyzed": int(len(working)),
+def goal_seek(
+    artifact: dict[str, Any],
+    stats: FeatureStats,
+    index: FeatureIndex,
+    target_roi: float,
+    features: list[str] | None = None,
+    suburb_name: str | None = None,
+    sal_code: str | None = None,
+    feature_values: dict[str, float] | None = None,
+    time_budget_ms: float = GOAL_SEEK_BUDGET_MS,
+) -> dict[str, Any]:
+    # Smallest change to the adjustable features that lifts the predicted ROI to the target.
+    # Each feature is normalized by the width of its get_feature_metadata range (read from
+    # the precomputed quantiles), which also bounds the search, widened to include the
+    # baseline value. The time budget covers the whole call.
+    started = time.perf_counter()
+    deadline = started + max(50.0, min(time_budget_ms, GOAL_SEEK_MAX_BUDGET_MS)) / 1000
+    features = list(dict.fromkeys(features or index.features))
+    unknown = [f for f in features if f not in index.features]
+    if unknown:
+        raise ValueError(f"Unknown model features: {', '.join(unknown)}.")
+    target = roi_threshold(target_roi)
+    bounds = {}
+    for f in features:
+        q = stats.quantiles[f]
+        low, high = _safe_range(q[0.0], q[0.25], q[0.75], q[1.0])
+        if np.isfinite(low) and np.isfinite(high):
+            bounds[f] = (low, high)
+    features = [f for f in features if f in bounds]
+    if not features:
+        raise ValueError("No adjustable features have a usable range.")
+
+    item = {"suburb_name": suburb_name, "sal_code": sal_code, "feature_values": feature_values}
+    baseline = np.nan_to_num(_build_input_matrix(index, [item])[0], nan=0.0, posinf=0.0, neginf=0.0)
+    columns = np.array([index.features.index(f) for f in features], dtype=np.intp)
+    origin = baseline[columns]
+    lo = np.minimum([bounds[f][0] for f in features], origin)
+    hi = np.maximum([bounds[f][1] for f in features], origin)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    packed = artifact.get("packed_forest")
+
+    def evaluate(steps: np.ndarray) -> np.ndarray:
+        matrix = np.tile(baseline, (len(steps), 1))
+        matrix[:, columns] = origin + steps * span
+        # Whole generations go through the packed evaluator, whose cost grows with the
+        # rows and carries no per-call overhead, so the generation sizing stays accurate.
+        if packed is not None:
+            return packed.predict(matrix)
+        return model_predict(artifact, pd.DataFrame(matrix, columns=list(index.features)))
+
+    result = seek_target(evaluate, (lo - origin) / span, (hi - origin) / span, target, deadline)
+    elapsed = time.perf_counter() - started
+
+    values = origin + result.step * span
+    changes = [
+        {"feature": f, "from": round(float(a), 4), "to": round(float(b), 4), "delta": round(float(b - a), 4)}
+        for f, a, b, step in zip(features, origin, values, result.step)
+        if step != 0
+    ]
+    return {
+        "suburb_name": suburb_name,
+        "target_roi_score": round(target, 6),
+        "reached": result.reached,
+        "predicted_roi_score": round(result.roi, 6),
+        "normalized_change": round(float(np.sqrt((result.step**2).sum())), 6),
+        "changes": sorted(changes, key=lambda c: -abs(c["delta"]) / span[features.index(c["feature"])]),
+        "evaluations": result.evaluations,
+        "generations": result.generations,
+        "elapsed_ms": round(elapsed * 1000, 1),
     }
 
-    cols = [
-        "name",
-        "roi",
-        "price",
-        "rent",
-        "seifa_score",
-        "Top20_Flag",
-        "insight_tags",
-    ]
-    rows = top[cols].fillna(0).to_dict(orient="records")
-    return {"summary": summary, "opportunities": rows}
+
+def investment_opportunities(
+    df: pd.DataFrame,
+    top_n: int = 20,
+    columns: InsightColumns | None = None,
+) -> dict[str, Any]:
+    if columns is None:
+        columns = InsightColumns.from_frame(df)
+    return columns.summarize(columns.roi_order, top_n, columns.global_thresholds)
 
 
 def filter_suburbs(
-    rows: list[dict[str, Any]],
+    store: SuburbStore,
     name: str | None = None,
     min_roi: float | None = None,
     max_price: float | None = None,
     min_seifa: float | None = None,
+    limit: int | None = None,
+    sort_by: str = "roi",
+    descending: bool = True,
+    min_roi_p10: float | None = None,
 ) -> list[dict[str, Any]]:
-    filtered = rows
-
-    if name:
-        filtered = [s for s in filtered if name.lower() in str(s.get("name", "")).lower()]
-
-    if min_roi is not None:
-        threshold = min_roi / 100 if min_roi > 1 else min_roi
-        filtered = [s for s in filtered if float(s.get("roi", 0) or 0) >= threshold]
-
-    if max_price is not None:
-        filtered = [s for s in filtered if float(s.get("price", 0) or 0) <= max_price]
-
-    if min_seifa is not None:
-        filtered = [s for s in filtered if float(s.get("seifa_score", 0) or 0) >= min_seifa]
-
-    return sorted(filtered, key=lambda x: float(x.get("roi", 0) or 0), reverse=True)
-
-
-def opportunities_from_rows(rows: list[dict[str, Any]], top_n: int = 20) -> dict[str, Any]:
-    if not rows:
-        return {
-            "summary": {
-                "avg_roi_percent_top_n": 0.0,
-                "median_roi_percent_all": 0.0,
-                "max_roi_percent": 0.0,
-                "suburbs_analyzed": 0,
-            },
-            "opportunities": [],
-        }
-
-    working = pd.DataFrame(rows).copy()
-    working["roi"] = pd.to_numeric(working.get("roi", 0), errors="coerce").fillna(0)
-    working["rent"] = pd.to_numeric(working.get("rent", 0), errors="coerce").fillna(0)
-    working["seifa_score"] = pd.to_numeric(working.get("seifa_score", 0), errors="coerce").fillna(0)
-    working["price"] = pd.to_numeric(working.get("price", 0), errors="coerce").fillna(0)
-
-    working = working.sort_values("roi", ascending=False)
-    top_n = max(5, min(top_n, 100))
-    top = working.head(top_n).copy()
-
-    rent_p75 = working["rent"].quantile(0.75)
-    seifa_p60 = working["seifa_score"].quantile(0.60)
-    mortgage_p40 = working["price"].quantile(0.40)
-
-    def tags(row: pd.Series) -> list[str]:
-        t: list[str] = []
-        if row.get("rent", 0) >= rent_p75:
-            t.append("High rent demand")
-        if row.get("seifa_score", 0) >= seifa_p60:
-            t.append("Socio-economic resilience")
-        if row.get("price", 0) <= mortgage_p40:
-            t.append("Relatively affordable")
-        if row.get("Top20_Flag", 0) == 1:
-            t.append("Top ROI cluster")
-        if not t:
-            t.append("Balanced profile")
-        return t
-
-    top["insight_tags"] = top.apply(tags, axis=1)
-
-    summary = {
-        "avg_roi_percent_top_n": round(float(top["roi"].mean() * 100), 2),
-        "median_roi_percent_all": round(float(working["roi"].median() * 100), 2),
-        "max_roi_percent": round(float(working["roi"].max() * 100), 2),
-        "suburbs_analyzed": int(len(working)),
-    }
-
-    cols = [
-        "name",
-        "roi",
-        "price",
-        "rent",
-        "seifa_score",
-        "Top20_Flag",
-        "insight_tags",
-    ]
-    opp_rows = top[cols].fillna(0).to_dict(orient="records")
-    return {"summary": summary, "opportunities": opp_rows}
+    indices = store.filter_indices(
+        name=name,
+        min_roi=min_roi,
+        max_price=max_price,
+        min_seifa=min_seifa,
+        limit=limit,
+        sort_by=sort_by,
+        descending=descending,
+        min_roi_p10=min_roi_p10,
+    )
+    return store.to_rows(indices)
+
+
+def suburb_page(
+    store: SuburbStore,
+    version: str,
+    cursor: str | None = None,
+    name: str | None = None,
+    min_roi: float | None = None,
+    max_price: float | None = None,
+    min_seifa: float | None = None,
+    limit: int = 100,
+    sort_by: str = "roi",
+    descending: bool = True,
+    min_roi_p10: float | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    keyset = sort_by == "roi" and descending
+    offset = 0
+    if cursor:
+        if not keyset:
+            raise InvalidCursor("Cursor pagination is only available for the default ROI-descending order.")
+        roi, code = decode_cursor(cursor, version)
+        position = store.position_after(roi, code)
+        if position is None:
+            raise InvalidCursor("Invalid pagination cursor.")
+        offset = position
+
+    # One extra row tells us whether another page exists.
+    indices = store.filter_indices(
+        name=name,
+        min_roi=min_roi,
+        max_price=max_price,
+        min_seifa=min_seifa,
+        limit=limit + 1,
+        sort_by=sort_by,
+        descending=descending,
+        offset=offset,
+        min_roi_p10=min_roi_p10,
+    )
+    next_cursor = None
+    if keyset and len(indices) > limit:
+        next_cursor = encode_cursor(version, *store.roi_key(int(indices[limit - 1])))
+    return store.to_rows(indices[:limit]), next_cursor
+
+
+def opportunities_from_indices(
+    columns: InsightColumns,
+    indices: np.ndarray,
+    top_n: int = 20,
+    filtered: bool = True,
+) -> dict[str, Any]:
+    # Without filters the matching rows are every row, so the cached global thresholds apply.
+    thresholds = None if filtered else columns.global_thresholds
+    return columns.summarize(indices, top_n, thresholds)
 
 
 def suburbs_closest_to_roi(
-    rows: list[dict[str, Any]],
+    store: SuburbStore,
     target_roi: float,
     top_n: int = 5,
 ) -> list[dict[str, Any]]:
-    if not rows:
-        return []
-
-    clean_rows: list[dict[str, Any]] = []
+    top_n = max(1, min(top_n, 20))
+    target_roi = float(target_roi)
+    rows = store.to_rows(store.nearest_roi(target_roi, top_n))
     for row in rows:
-        roi_value = pd.to_numeric(row.get("roi", 0), errors="coerce")
-        if pd.isna(roi_value):
-            continue
-        candidate = dict(row)
-        candidate["roi"] = float(roi_value)
-        candidate["roi_diff"] = abs(float(roi_value) - float(target_roi))
-        clean_rows.append(candidate)
+        row["roi"] = float(row["roi"])
+        row["roi_diff"] = abs(row["roi"] - target_roi)
+    return rows
 
-    clean_rows.sort(key=lambda x: (x["roi_diff"], -x["roi"]))
-    top_n = max(1, min(top_n, 20))
-    return clean_rows[:top_n]
+
+def similar_suburbs(
+    store: SuburbStore,
+    similarity: SimilarityIndex,
+    row: int,
+    k: int = 10,
+    min_roi: float | None = None,
+    max_price: float | None = None,
+    min_seifa: float | None = None,
+) -> dict[str, Any]:
+    k = max(1, min(k, 50))
+    allowed = None
+    if min_roi is not None or max_price is not None or min_seifa is not None:
+        allowed = store.mask(min_roi=min_roi, max_price=max_price, min_seifa=min_seifa, indices=similarity.rows)
+    rows, distance = similarity.nearest(row, k, allowed)
+    suburb, *similar = store.to_rows(np.concatenate([[row], rows]))
+    suburb["sal_code"] = store.codes[row]
+    for item, idx, d in zip(similar, rows.tolist(), distance.tolist()):
+        item["sal_code"] = store.codes[idx]
+        item["distance"] = round(d, 4)
+    return {"suburb": suburb, "similar": similar}
+
+
+def pareto_frontier(
+    df: pd.DataFrame,
+    store: SuburbStore,
+    objectives: tuple[str, ...],
+    layers: int = 1,
+) -> dict[str, Any]:
+    # Rows missing a name or any chosen objective take no part rather than competing with
+    # a filled-in zero.
+    valid = df["name"].notna().to_numpy(copy=True) if "name" in df.columns else np.ones(len(df), dtype=bool)
+    columns = []
+    for objective in objectives:
+        values = pd.to_numeric(df[objective], errors="coerce").to_numpy(dtype=float) if objective in df.columns else np.zeros(len(df))
+        valid &= ~np.isnan(values)
+        columns.append(values * OBJECTIVES[objective])
+    rows = np.flatnonzero(valid)
+    layer = frontier_layers(np.column_stack(columns)[rows], layers)
+
+    result = []
+    for depth in range(1, layers + 1):
+        members = rows[layer == depth]
+        if not len(members):
+            break
+        members = members[np.argsort(-store.numeric("roi")[members], kind="stable")]
+        suburbs = store.to_rows(members)
+        for item, idx in zip(suburbs, members.tolist()):
+            item["sal_code"] = store.codes[idx]
+        result.append({"layer": depth, "count": len(suburbs), "suburbs": suburbs})
+    return {
+        "objectives": {name: "max" if OBJECTIVES[name] > 0 else "min" for name in objectives},
+        "layers": result,
+    }
 
 
-def suburb_names(df: pd.DataFrame, q: str | None, limit: int = 200) -> list[str]:
-    names = df["name"].dropna().astype(str)
+def score_suburbs(
+    store: SuburbStore,
+    scores: ScoreMatrix,
+    weights: dict[str, float],
+    top_n: int = 20,
+    min_roi: float | None = None,
+    max_price: float | None = None,
+    min_seifa: float | None = None,
+) -> dict[str, Any]:
+    top_n = max(1, min(top_n, 500))
+    allowed = None
+    if min_roi is not None or max_price is not None or min_seifa is not None:
+        allowed = store.mask(min_roi=min_roi, max_price=max_price, min_seifa=min_seifa, indices=scores.rows)
+    rows, values = scores.top(weights, top_n, allowed)
+    suburbs = store.to_rows(rows)
+    for item, idx, value in zip(suburbs, rows.tolist(), values.tolist()):
+        item["sal_code"] = store.codes[idx]
+        item["score"] = round(value, 6)
+    return {"weights": weights, "count": len(suburbs), "suburbs": suburbs}
+
+
+def suburb_names(index: NameIndex, q: str | None, limit: int = 200) -> list[str]:
+    limit = max(1, min(limit, 1000))
     if q:
-        names = names[names.str.contains(q, case=False, na=False)]
-    unique_names = sorted(names.unique().tolist())
-    return unique_names[: max(1, min(limit, 1000))]
+        return index.search(q, limit)
+    return index.labels[:limit]
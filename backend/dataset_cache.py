@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Bump when the scored columns or the on-disk layout change.
+CACHE_FORMAT = "3"
+
+
+def bytes_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def scored_dataset_key(csv_digest: str, model_digest: str) -> str:
+    return hashlib.sha256(f"{CACHE_FORMAT}:{csv_digest}:{model_digest}".encode()).hexdigest()
+
+
+def read_cached_frame(path: Path, key: str) -> pd.DataFrame | None:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["__key__"]) != key:
+                return None
+            columns = data["__columns__"].tolist()
+            dtypes = data["__dtypes__"].tolist()
+            frame: dict[str, pd.Series] = {}
+            for i, (col, dtype) in enumerate(zip(columns, dtypes)):
+                values = data[f"c{i}"]
+                if f"m{i}" in data.files:
+                    series = pd.Series(values.astype(object))
+                    series[data[f"m{i}"]] = np.nan
+                    frame[col] = series.astype(dtype)
+                else:
+                    frame[col] = pd.Series(values)
+    except (OSError, KeyError, ValueError):
+        return None
+    return pd.DataFrame(frame)
+
+
+def write_cached_frame(path: Path, key: str, df: pd.DataFrame) -> None:
+    arrays: dict[str, np.ndarray] = {
+        "__key__": np.array(key),
+        "__columns__": np.array([str(c) for c in df.columns]),
+        "__dtypes__": np.array([str(df[c].dtype) for c in df.columns]),
+    }
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            arrays[f"c{i}"] = series.to_numpy()
+        else:
+            missing = series.isna().to_numpy()
+            arrays[f"c{i}"] = np.array(["" if m else str(v) for v, m in zip(series.tolist(), missing)])
+            arrays[f"m{i}"] = missing
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class LaneSaturated(Exception):
+    def __init__(self, lane: str):
+        super().__init__(f"The {lane} queue is full, retry shortly.")
+        self.lane = lane
+
+
+# A bounded thread pool for one class of CPU-bound work. `max_workers` caps how many jobs
+# run at once and `max_queue` caps how many may wait behind them; past that, submissions
+# are rejected instead of piling up behind slow jobs. The event loop only awaits the
+# future, so cheap endpoints keep answering while reports render.
+class WorkLane:
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"lane-{name}")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            if self._queued >= self.max_queue and self._running >= self.max_workers:
+                self._rejected += 1
+                raise LaneSaturated(self.name)
+            self._queued += 1
+
+        submitted = time.perf_counter()
+        started = abandoned = False
+
+        def call() -> T:
+            nonlocal started
+            with self._lock:
+                if abandoned:
+                    # The caller gave up while this job was queued and already freed its slot.
+                    raise CancelledError()
+                started = True
+                self._queued -= 1
+                self._running += 1
+                self._wait_total += time.perf_counter() - submitted
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+        finally:
+            # A job cancelled while still queued never reaches call(), so release its slot here.
+            with self._lock:
+                if not started:
+                    abandoned = True
+                    self._queued -= 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            started = self._completed + self._running
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._queued,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_queue_wait_ms": round(self._wait_total / started * 1000, 3) if started else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
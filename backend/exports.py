@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import csv
+from io import StringIO
+from typing import Iterator
+import zlib
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 2000
+EXPORT_LEAD_COLUMNS = [
+    "SAL_CODE_2021",
+    "name",
+    "roi",
+    "roi_p10",
+    "roi_p50",
+    "roi_p90",
+    "roi_std",
+    "price",
+    "rent",
+    "seifa_score",
+    "Top20_Flag",
+]
+
+
+def export_columns(df: pd.DataFrame, model_features: list[str]) -> list[str]:
+    columns = [c for c in EXPORT_LEAD_COLUMNS if c in df.columns]
+    return columns + [f for f in model_features if f in df.columns and f not in columns]
+
+
+def _cells(values: np.ndarray) -> list:
+    cells = values.tolist()
+    # Missing values become empty cells rather than "nan".
+    return ["" if v is None or v != v else v for v in cells]
+
+
+def iter_csv_rows(df: pd.DataFrame, indices: np.ndarray, columns: list[str]) -> Iterator[str]:
+    arrays = [df[c].to_numpy() for c in columns]
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    for start in range(0, len(indices), CHUNK_ROWS):
+        chunk = indices[start : start + CHUNK_ROWS]
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(zip(*(_cells(values[chunk]) for values in arrays)))
+        yield buffer.getvalue()
+
+
+def gzip_chunks(chunks: Iterator[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_csv_export(
+    df: pd.DataFrame,
+    indices: np.ndarray,
+    columns: list[str],
+    compress: bool = False,
+) -> Iterator[bytes]:
+    chunks = iter_csv_rows(df, indices, columns)
+    if compress:
+        return gzip_chunks(chunks)
+    return (chunk.encode("utf-8") for chunk in chunks)
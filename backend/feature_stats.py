@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+QUANTILES = (0.0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0)
+# Scored-dataset columns holding each row's path contribution per model feature.
+CONTRIBUTION_PREFIX = "contrib_"
+
+
+# Column statistics computed once per dataset so predictions only do lookups.
+@dataclass(frozen=True)
+class FeatureStats:
+    features: tuple[str, ...]
+    medians: Mapping[str, float]
+    stds: Mapping[str, float]
+    quantiles: Mapping[str, Mapping[float, float]]
+    historical_roi: np.ndarray
+
+    def roi_percentiles(self, roi_scores: np.ndarray) -> np.ndarray:
+        if not len(self.historical_roi):
+            return np.zeros(len(roi_scores), dtype=float)
+        below_or_equal = np.searchsorted(self.historical_roi, roi_scores, side="right")
+        return below_or_equal / len(self.historical_roi) * 100
+
+
+def _frozen_array(values: np.ndarray) -> np.ndarray:
+    values = np.ascontiguousarray(values)
+    values.setflags(write=False)
+    return values
+
+
+def build_feature_stats(df: pd.DataFrame, model_features: list[str]) -> FeatureStats:
+    features = tuple(f for f in model_features if f in df.columns)
+    medians: dict[str, float] = {}
+    stds: dict[str, float] = {}
+    quantiles: dict[str, Mapping[float, float]] = {}
+
+    for f in features:
+        s = pd.to_numeric(df[f], errors="coerce")
+        medians[f] = float(s.median())
+        stds[f] = float(s.std())
+        q = s.quantile(list(QUANTILES))
+        quantiles[f] = MappingProxyType({p: float(q.loc[p]) for p in QUANTILES})
+
+    historical = pd.to_numeric(df["roi"], errors="coerce").dropna().to_numpy(dtype=float)
+
+    return FeatureStats(
+        features=features,
+        medians=MappingProxyType(medians),
+        stds=MappingProxyType(stds),
+        quantiles=MappingProxyType(quantiles),
+        historical_roi=_frozen_array(np.sort(historical)),
+    )
+
+
+# Model-feature matrix with NaNs imputed by the column median, plus hash lookups from a
+# case-folded suburb name or SAL code to its row. Repeated names resolve to the first row
+# in dataset order, matching the previous first-match lookup.
+class FeatureIndex:
+    def __init__(self, df: pd.DataFrame, stats: FeatureStats):
+        self.features = stats.features
+        matrix = np.empty((len(df), len(self.features)), dtype=float)
+        for j, f in enumerate(self.features):
+            col = pd.to_numeric(df[f], errors="coerce").to_numpy(dtype=float)
+            matrix[:, j] = np.where(np.isnan(col), stats.medians[f], col)
+        self.matrix = _frozen_array(matrix)
+        self.medians = _frozen_array(np.array([stats.medians[f] for f in self.features], dtype=float))
+        contribution_columns = [CONTRIBUTION_PREFIX + f for f in self.features]
+        self.contributions: np.ndarray | None = None
+        if all(c in df.columns for c in contribution_columns):
+            self.contributions = _frozen_array(df[contribution_columns].to_numpy(dtype=float))
+
+        self.by_name: dict[str, int] = {}
+        if "name" in df.columns:
+            for i, name in enumerate(df["name"].tolist()):
+                if isinstance(name, str):
+                    self.by_name.setdefault(name.casefold(), i)
+
+        self.by_code: dict[str, int] = {}
+        if "SAL_CODE_2021" in df.columns:
+            for i, code in enumerate(df["SAL_CODE_2021"].tolist()):
+                if pd.notna(code) and str(code):
+                    self.by_code.setdefault(str(code), i)
+
+    def row_index(self, suburb_name: str | None = None, sal_code: str | None = None) -> int | None:
+        if sal_code:
+            idx = self.by_code.get(str(sal_code).strip())
+            if idx is not None:
+                return idx
+        if suburb_name:
+            return self.by_name.get(suburb_name.casefold())
+        return None
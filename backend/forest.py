@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+ROW_BLOCK = 2048
+INTERVAL_PERCENTILES = (10, 50, 90)
+
+
+# A fitted RandomForestRegressor flattened into one set of node arrays. Rows are pushed
+# through every tree at once, one tree level per step, which skips sklearn's per-call
+# validation and joblib dispatch. Leaves point back at themselves so the walk can run a
+# fixed number of levels.
+class PackedForest:
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        missing_left: np.ndarray,
+        roots: np.ndarray,
+        depth: int,
+        n_features: int,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.missing_left = missing_left
+        self.roots = roots
+        self.depth = depth
+        self.n_features = n_features
+        # Interleaved (right, left) pairs so the next node is children[2 * node + go_left].
+        self._children = np.stack([right, left], axis=1).ravel()
+
+    @classmethod
+    def from_model(cls, model: Any) -> "PackedForest | None":
+        estimators = getattr(model, "estimators_", None)
+        if not estimators or getattr(model, "n_outputs_", 1) != 1:
+            return None
+
+        features, thresholds, lefts, rights, values, missing, roots = [], [], [], [], [], [], []
+        offset = 0
+        for est in estimators:
+            tree = est.tree_
+            nodes = tree.__getstate__()["nodes"]
+            count = tree.node_count
+            own = np.arange(count, dtype=np.intp)
+            is_leaf = tree.children_left == -1
+
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.intp))
+            thresholds.append(tree.threshold.astype(np.float64))
+            lefts.append(np.where(is_leaf, own, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, own, tree.children_right) + offset)
+            values.append(tree.value[:, 0, 0].astype(np.float64))
+            if "missing_go_to_left" in nodes.dtype.names:
+                missing.append(nodes["missing_go_to_left"].astype(bool))
+            else:
+                missing.append(np.zeros(count, dtype=bool))
+            roots.append(offset)
+            offset += count
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            value=np.concatenate(values),
+            missing_left=np.concatenate(missing),
+            roots=np.array(roots, dtype=np.intp),
+            depth=max(est.tree_.max_depth for est in estimators),
+            n_features=int(model.n_features_in_),
+        )
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def _prepare(self, X: Any) -> np.ndarray:
+        # sklearn compares float32 inputs against float64 thresholds; match it exactly.
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}.")
+        return X
+
+    def _blocks(self, X: np.ndarray):
+        # Per block of rows: the block and a step function moving a (rows, trees) array of
+        # nodes one level down. Leaves step onto themselves.
+        has_missing = bool(np.isnan(X).any())
+        for start in range(0, len(X), ROW_BLOCK):
+            block = X[start : start + ROW_BLOCK]
+            flat = block.ravel()
+            row_base = (np.arange(len(block), dtype=np.intp) * block.shape[1])[:, None]
+
+            def step(nodes: np.ndarray, flat=flat, row_base=row_base) -> np.ndarray:
+                x = flat[row_base + self.feature[nodes]]
+                go_left = x <= self.threshold[nodes]
+                if has_missing:
+                    go_left = np.where(np.isnan(x), self.missing_left[nodes], go_left)
+                return self._children[2 * nodes + go_left]
+
+            yield start, block, step
+
+    def apply(self, X: Any) -> np.ndarray:
+        X = self._prepare(X)
+        leaves = np.empty((len(X), self.n_trees), dtype=np.intp)
+        for start, block, step in self._blocks(X):
+            nodes = np.broadcast_to(self.roots, (len(block), self.n_trees)).copy()
+            for _ in range(self.depth):
+                nodes = step(nodes)
+            leaves[start : start + ROW_BLOCK] = nodes
+        return leaves
+
+    @property
+    def bias(self) -> float:
+        # Forest-average root value: the prediction before any split is taken.
+        return float(self.value[self.roots].mean()) if self.n_trees else 0.0
+
+    def contributions(self, X: Any) -> np.ndarray:
+        # Exact path attribution (Saabas): every split on a row's path moves the running
+        # node value from parent to child, and that change is credited to the split
+        # feature. Averaged over the trees, bias + contributions.sum(axis=1) is the
+        # forest prediction.
+        X = self._prepare(X)
+        out = np.zeros((len(X), self.n_features), dtype=float)
+        for start, block, step in self._blocks(X):
+            nodes = np.broadcast_to(self.roots, (len(block), self.n_trees)).copy()
+            cells = (np.arange(len(block), dtype=np.intp) * self.n_features)[:, None]
+            total = np.zeros(len(block) * self.n_features, dtype=float)
+            for _ in range(self.depth):
+                children = step(nodes)
+                # Leaves step onto themselves, so they add a zero change.
+                total += np.bincount(
+                    (cells + self.feature[nodes]).ravel(),
+                    weights=(self.value[children] - self.value[nodes]).ravel(),
+                    minlength=len(total),
+                )
+                nodes = children
+            out[start : start + ROW_BLOCK] = total.reshape(len(block), self.n_features) / max(self.n_trees, 1)
+        return out
+
+    def tree_predictions(self, X: Any) -> np.ndarray:
+        return self.value[self.apply(X)]
+
+    def predict(self, X: Any) -> np.ndarray:
+        return self.mean(self.tree_predictions(X))
+
+    def mean(self, per_tree: np.ndarray) -> np.ndarray:
+        # Accumulate tree by tree, in estimator order, exactly as the forest does.
+        total = np.cumsum(per_tree, axis=1)[:, -1] if per_tree.shape[1] else np.zeros(len(per_tree))
+        return total / self.n_trees
+
+
+def tree_spread(per_tree: np.ndarray) -> np.ndarray:
+    # (rows, 4) array of P10, P50, P90 and standard deviation across the trees.
+    if not per_tree.shape[1]:
+        return np.zeros((len(per_tree), 4))
+    quantiles = np.percentile(per_tree, INTERVAL_PERCENTILES, axis=1)
+    return np.column_stack([*quantiles, per_tree.std(axis=1)])
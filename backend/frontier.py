@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+
+import numpy as np
+
+# +1 means higher is better, -1 lower is better.
+OBJECTIVES = {
+    "roi": 1,
+    "price": -1,
+    "seifa_score": 1,
+    "rent": 1,
+    "yield_pct": 1,
+    "growth_pct": 1,
+}
+DEFAULT_OBJECTIVES = ("roi", "price", "seifa_score")
+MAX_LAYERS = 10
+FILTER_BLOCK = 256
+
+
+def normalize_objectives(names: list[str]) -> tuple[str, ...]:
+    # Canonical order so equivalent requests share a cache entry.
+    chosen = {n.strip() for n in names if n.strip()}
+    unknown = sorted(chosen - set(OBJECTIVES))
+    if unknown:
+        raise ValueError(f"Unknown objectives: {', '.join(unknown)}. Choose from {', '.join(OBJECTIVES)}.")
+    if not chosen:
+        raise ValueError("At least one objective is required.")
+    return tuple(n for n in OBJECTIVES if n in chosen)
+
+
+def _staircase_skyline(points: np.ndarray) -> np.ndarray:
+    # Non-dominated rows of up to three maximized columns, with no duplicate rows. After a
+    # lexicographic sort every dominator of a point comes before it, so a point survives
+    # iff no earlier point beats it on the last two columns. Those are kept as a staircase
+    # ordered by the second column ascending (third descending), which answers the check
+    # with one binary search.
+    padded = np.zeros((len(points), 3), dtype=float)
+    padded[:, : points.shape[1]] = points
+    order = np.lexsort((-padded[:, 2], -padded[:, 1], -padded[:, 0]))
+
+    keep = np.zeros(len(points), dtype=bool)
+    xs: list[float] = []
+    ys: list[float] = []
+    for i, x, y in zip(order.tolist(), padded[order, 1].tolist(), padded[order, 2].tolist()):
+        pos = bisect_left(xs, x)
+        if pos < len(xs) and ys[pos] >= y:
+            continue
+        keep[i] = True
+        # Drop the steps the new point now covers: x' <= x and y' <= y.
+        start = pos
+        while start > 0 and ys[start - 1] <= y:
+            start -= 1
+        if pos < len(xs) and xs[pos] == x:
+            pos += 1
+        xs[start:pos] = [x]
+        ys[start:pos] = [y]
+    return keep
+
+
+def _dominated(candidates: np.ndarray, others: np.ndarray) -> np.ndarray:
+    # Whether each candidate is dominated by at least one of `others`. Looping over the
+    # few columns keeps every temporary two-dimensional.
+    at_least = np.ones((len(candidates), len(others)), dtype=bool)
+    better = np.zeros_like(at_least)
+    for j in range(candidates.shape[1]):
+        c, o = candidates[:, j, None], others[None, :, j]
+        at_least &= o >= c
+        better |= o > c
+    return (at_least & better).any(axis=1)
+
+
+def _filter_skyline(points: np.ndarray) -> np.ndarray:
+    # Sort-filter skyline for more than three objectives: after sorting by the sum of the
+    # min-max scaled columns, descending, no point can be dominated by one that comes
+    # later, so each point is only compared against the skyline found so far.
+    low, span = points.min(axis=0), np.ptp(points, axis=0)
+    scaled = (points - low) / np.where(span > 0, span, 1.0)
+    order = np.argsort(-scaled.sum(axis=1), kind="stable")
+    # The best-scoring points dominate most of the rest; discarding those up front keeps
+    # the blocks below small.
+    order = order[~_dominated(points[order], points[order[:FILTER_BLOCK]])]
+    keep = np.zeros(len(points), dtype=bool)
+    front = np.empty((0, points.shape[1]), dtype=float)
+    for start in range(0, len(order), FILTER_BLOCK):
+        block = order[start : start + FILTER_BLOCK]
+        # A point dominated by anything, survivor or not, is dominated by some survivor,
+        # so one vectorized pass against the block and the skyline so far is enough.
+        survivors = block[~_dominated(points[block], np.vstack([front, points[block]]))]
+        keep[survivors] = True
+        front = np.vstack([front, points[survivors]])
+    return keep
+
+
+def skyline(points: np.ndarray) -> np.ndarray:
+    # Boolean mask of the rows no other row dominates (all columns maximized).
+    if not len(points):
+        return np.zeros(0, dtype=bool)
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    if unique.shape[1] <= 3:
+        keep = _staircase_skyline(unique)
+    else:
+        keep = _filter_skyline(unique)
+    # Identical rows share their status.
+    return keep[inverse.reshape(-1)]
+
+
+def frontier_layers(points: np.ndarray, layers: int) -> np.ndarray:
+    # Layer number per row (1 = Pareto frontier, 2 = frontier once layer 1 is removed, ...),
+    # 0 for rows beyond the requested depth.
+    layer = np.zeros(len(points), dtype=np.intp)
+    remaining = np.arange(len(points))
+    for depth in range(1, layers + 1):
+        if not len(remaining):
+            break
+        front = skyline(points[remaining])
+        layer[remaining[front]] = depth
+        remaining = remaining[~front]
+    return layer
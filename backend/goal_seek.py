@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+POPULATION = 2048
+FIRST_GENERATION = 256
+ELITES = 64
+# Generations are sized so at least this many more fit in the remaining time.
+GENERATIONS_AHEAD = 3
+MAX_GENERATIONS = 40
+STALL_GENERATIONS = 6
+
+
+@dataclass(frozen=True)
+class SeekResult:
+    step: np.ndarray
+    roi: float
+    reached: bool
+    evaluations: int
+    generations: int
+
+
+def _clip(steps: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    return np.minimum(np.maximum(steps, lower), upper)
+
+
+def _initial(rng: np.random.Generator, lower: np.ndarray, upper: np.ndarray, size: int) -> np.ndarray:
+    # Uniform over the box, with each candidate only moving a random subset of features:
+    # small changes tend to touch few of them.
+    d = len(lower)
+    steps = lower + rng.random((size, d)) * (upper - lower)
+    keep = rng.random((size, d)) < rng.choice([1 / d, 0.3, 1.0], size=size)[:, None]
+    return np.where(keep, steps, 0.0)
+
+
+def _offspring(
+    rng: np.random.Generator,
+    elites: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    size: int,
+    sigma: float,
+    feasible: bool,
+) -> np.ndarray:
+    parents = elites[rng.integers(len(elites), size=size)]
+    kind = rng.integers(3, size=size)
+    children = parents + rng.normal(0.0, sigma, parents.shape)
+    if feasible:
+        # Pull toward the baseline along the ray, or reset one feature to it.
+        shrink = kind == 1
+        children[shrink] = parents[shrink] * rng.uniform(0.5, 1.0, (int(shrink.sum()), 1))
+        reset = np.flatnonzero(kind == 2)
+        children[reset] = parents[reset]
+        children[reset, rng.integers(parents.shape[1], size=len(reset))] = 0.0
+    else:
+        # Nothing reaches the target yet: push the best candidates further out.
+        grow = kind != 0
+        children[grow] = parents[grow] * rng.uniform(1.0, 1.5, (int(grow.sum()), 1))
+    return _clip(children, lower, upper)
+
+
+def seek_target(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    target: float,
+    deadline: float,
+    population: int = POPULATION,
+    seed: int = 0,
+) -> SeekResult:
+    # Smallest step (Euclidean, in normalized units, 0 = baseline) inside [lower, upper]
+    # whose predicted ROI reaches `target`, searched until `deadline` (a perf_counter
+    # value). `evaluate` scores a whole generation of steps with one model call. Elites
+    # are the cheapest candidates that reach the target, or the highest-ROI ones until
+    # something does. The first generation is small; its cost per row then sizes the
+    # next ones (up to `population`) so the search never starts a call it cannot finish.
+    rng = np.random.default_rng(seed)
+    size = min(population, FIRST_GENERATION)
+    steps = np.vstack([np.zeros((1, len(lower))), _initial(rng, lower, upper, size - 1)])
+
+    best_step, best_cost, best_roi, reached = steps[0], np.inf, -np.inf, False
+    evaluations = generations = stalled = 0
+    row_cost = 0.0
+    while True:
+        generation_start = time.perf_counter()
+        roi = evaluate(steps)
+        now = time.perf_counter()
+        row_cost = (now - generation_start) / len(steps)
+        evaluations += len(steps)
+        generations += 1
+        cost = np.sqrt((steps**2).sum(axis=1))
+
+        hits = np.flatnonzero(roi >= target)
+        improved = False
+        if len(hits):
+            i = hits[np.argmin(cost[hits])]
+            if cost[i] < best_cost - 1e-6:
+                improved = True
+                best_step, best_cost, best_roi, reached = steps[i], float(cost[i]), float(roi[i]), True
+            elites = steps[hits[np.argsort(cost[hits], kind="stable")[:ELITES]]]
+        else:
+            i = int(np.argmax(roi))
+            if not reached and roi[i] > best_roi:
+                improved = True
+                best_step, best_roi = steps[i], float(roi[i])
+            elites = steps[np.argsort(-roi, kind="stable")[:ELITES]]
+        if reached and best_cost == 0:
+            break
+        stalled = 0 if improved else stalled + 1
+
+        size = min(population, int((deadline - now) / (row_cost * GENERATIONS_AHEAD)))
+        if size < ELITES or generations >= MAX_GENERATIONS or stalled >= STALL_GENERATIONS:
+            break
+        if reached:
+            # Keep the best step in the pool so a generation never loses it.
+            elites = np.vstack([best_step[None, :], elites])
+            sigma = max(best_cost, 1e-3) * 0.1
+        else:
+            sigma = 0.1
+        steps = _offspring(rng, elites, lower, upper, size, sigma, reached)
+
+    if reached:
+        best_step, best_roi, extra = _prune(evaluate, best_step, best_roi, target, deadline, row_cost)
+        evaluations += extra
+    return SeekResult(best_step, best_roi, reached, evaluations, generations)
+
+
+def _prune(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    step: np.ndarray,
+    roi: float,
+    target: float,
+    deadline: float,
+    row_cost: float,
+) -> tuple[np.ndarray, float, int]:
+    # Greedy clean-up of the winner: while some feature can go back to its baseline value
+    # (or the whole step can shrink) and still reach the target, take the cheapest such
+    # variant. Each round is one small call; rounds stop at the deadline with the best
+    # step so far.
+    evaluations = 0
+    scales = np.linspace(0.5, 0.98, 25)[:, None]
+    while step.any():
+        moved = np.flatnonzero(step)
+        variants = np.repeat(step[None, :], len(moved), axis=0)
+        variants[np.arange(len(moved)), moved] = 0.0
+        variants = np.vstack([variants, step * scales])
+        start = time.perf_counter()
+        if start + row_cost * len(variants) > deadline:
+            break
+        scores = evaluate(variants)
+        row_cost = (time.perf_counter() - start) / len(variants)
+        evaluations += len(variants)
+        hits = np.flatnonzero(scores >= target)
+        if not len(hits):
+            break
+        i = hits[np.argmin((variants[hits] ** 2).sum(axis=1))]
+        step, roi = variants[i], float(scores[i])
+    return step, roi, evaluations
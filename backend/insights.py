@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from suburb_store import SuburbStore
+
+TAG_LABELS = (
+    "High rent demand",
+    "Socio-economic resilience",
+    "Relatively affordable",
+    "Top ROI cluster",
+)
+DEFAULT_TAG = "Balanced profile"
+
+EMPTY_SUMMARY = {
+    "avg_roi_percent_top_n": 0.0,
+    "median_roi_percent_all": 0.0,
+    "max_roi_percent": 0.0,
+    "suburbs_analyzed": 0,
+}
+
+
+def _as_float(values: Any, length: int) -> np.ndarray:
+    if values is None:
+        return np.zeros(length, dtype=float)
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+
+
+def _output(values: np.ndarray) -> list[Any]:
+    if values.dtype.kind == "f":
+        values = np.where(np.isnan(values), 0, values)
+    return values.tolist()
+
+
+# The columns behind the insight tags and summary KPIs, kept as arrays so tagging is a
+# handful of vectorized comparisons. Tag thresholds over every row are computed once.
+class InsightColumns:
+    def __init__(
+        self,
+        names: np.ndarray,
+        roi: np.ndarray,
+        price: np.ndarray,
+        rent: np.ndarray,
+        seifa_score: np.ndarray,
+        top20: np.ndarray,
+    ):
+        self.names = names
+        self.roi = roi
+        self.price = price
+        self.rent = rent
+        self.seifa_score = seifa_score
+        self.top20 = top20
+        # Stable sort keeps dataset order between equal ROI values.
+        self.roi_order = np.argsort(-roi, kind="stable")
+        self.global_thresholds = self.thresholds(None)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "InsightColumns":
+        df = df.dropna(subset=["name", "roi"])
+        n = len(df)
+        top20 = df["Top20_Flag"].to_numpy() if "Top20_Flag" in df.columns else np.zeros(n, dtype=int)
+        return cls(
+            names=df["name"].to_numpy(dtype=object),
+            roi=_as_float(df["roi"], n),
+            price=_as_float(df.get("price"), n),
+            rent=_as_float(df.get("rent"), n),
+            seifa_score=_as_float(df.get("seifa_score"), n),
+            top20=top20,
+        )
+
+    @classmethod
+    def from_store(cls, store: "SuburbStore") -> "InsightColumns":
+        names = store.names if store.names is not None else np.zeros(len(store), dtype=object)
+        top20 = store.columns.get("Top20_Flag")
+        return cls(
+            names=names,
+            roi=store.numeric("roi").astype(float),
+            price=store.numeric("price").astype(float),
+            rent=store.numeric("rent").astype(float),
+            seifa_score=store.numeric("seifa_score").astype(float),
+            top20=np.zeros(len(store), dtype=int) if top20 is None else top20,
+        )
+
+    def __len__(self) -> int:
+        return len(self.roi)
+
+    def thresholds(self, indices: np.ndarray | None) -> tuple[float, float, float]:
+        def pick(values: np.ndarray) -> np.ndarray:
+            return values if indices is None else values[indices]
+
+        if not len(self.roi) or (indices is not None and not len(indices)):
+            return (np.nan, np.nan, np.nan)
+        # Same linear interpolation (and NaN skipping) as Series.quantile.
+        return (
+            float(np.nanpercentile(pick(self.rent), 75)),
+            float(np.nanpercentile(pick(self.seifa_score), 60)),
+            float(np.nanpercentile(pick(self.price), 40)),
+        )
+
+    def tags(self, indices: np.ndarray, thresholds: tuple[float, float, float]) -> list[list[str]]:
+        rent_p75, seifa_p60, mortgage_p40 = thresholds
+        flags = np.column_stack(
+            [
+                self.rent[indices] >= rent_p75,
+                self.seifa_score[indices] >= seifa_p60,
+                self.price[indices] <= mortgage_p40,
+                self.top20[indices] == 1,
+            ]
+        )
+        return [[label for label, on in zip(TAG_LABELS, row) if on] or [DEFAULT_TAG] for row in flags.tolist()]
+
+    def summarize(
+        self,
+        order: np.ndarray,
+        top_n: int,
+        thresholds: tuple[float, float, float] | None = None,
+    ) -> dict[str, Any]:
+        if not len(order):
+            return {"summary": dict(EMPTY_SUMMARY), "opportunities": []}
+
+        top_n = max(5, min(top_n, 100))
+        top = order[:top_n]
+        if thresholds is None:
+            thresholds = self.thresholds(order)
+
+        roi_all = self.roi[order]
+        summary = {
+            "avg_roi_percent_top_n": round(float(self.roi[top].mean() * 100), 2),
+            "median_roi_percent_all": round(float(np.nanmedian(roi_all) * 100), 2),
+            "max_roi_percent": round(float(np.nanmax(roi_all) * 100), 2),
+            "suburbs_analyzed": int(len(order)),
+        }
+
+        columns = {
+            "name": self.names[top].tolist(),
+            "roi": _output(self.roi[top]),
+            "price": _output(self.price[top]),
+            "rent": _output(self.rent[top]),
+            "seifa_score": _output(self.seifa_score[top]),
+            "Top20_Flag": _output(self.top20[top]),
+            "insight_tags": self.tags(top, thresholds),
+        }
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        return {"summary": summary, "opportunities": rows}
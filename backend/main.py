@@ -1,34 +1,110 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
 from io import BytesIO, StringIO
 import csv
-from typing import Optional
+import os
+from typing import Any, Callable, Literal, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Spacer, Paragraph, Table, TableStyle
 
+from batching import MicroBatcher
 from data_loader import (
-    dataset_to_api_rows,
-    filter_suburbs,
+    GOAL_SEEK_BUDGET_MS,
     get_feature_metadata,
+    goal_seek,
     investment_opportunities,
-    load_dataset,
-    load_model_artifact,
-    opportunities_from_rows,
+    opportunities_from_indices,
+    pareto_frontier,
+    predict_batch,
     predict_from_inputs,
+    predict_sweep,
+    score_suburbs,
+    similar_suburbs,
+    suburb_page,
     suburbs_closest_to_roi,
     suburb_names,
     user_input_guidance,
 )
+from executors import LaneSaturated, WorkLane
+from exports import export_columns, iter_csv_export
+from frontier import DEFAULT_OBJECTIVES, MAX_LAYERS, normalize_objectives
+from pagination import InvalidCursor, StaleCursor
+from report_cache import ReportCache, ReportFilters, body_etag, normalize_report_filters
+from scoring import MAX_WEIGHT, PRESETS as SCORE_PRESETS
+from serving import ServingSnapshot, SnapshotManager
+from static_bodies import COMPRESSORS, encode_json, etag_matches, negotiate_encoding, static_etag
+
+# Seconds between checks for a new CSV or model artifact; 0 disables hot reload.
+RELOAD_INTERVAL = float(os.environ.get("ROI_RELOAD_INTERVAL", "10"))
+
+SNAPSHOTS = SnapshotManager(interval=RELOAD_INTERVAL)
+
+# CPU-bound handlers run on these bounded pools instead of the event loop.
+PREDICT_LANE = WorkLane("predict", max_workers=4, max_queue=64)
+INSIGHTS_LANE = WorkLane("insights", max_workers=2, max_queue=32)
+REPORT_LANE = WorkLane("report", max_workers=2, max_queue=8)
+# Each goal seek deliberately spends up to its time budget, so it gets its own small lane
+# instead of holding predict workers.
+GOAL_SEEK_LANE = WorkLane("goal_seek", max_workers=2, max_queue=4)
+LANES = (PREDICT_LANE, INSIGHTS_LANE, REPORT_LANE, GOAL_SEEK_LANE)
+
+
+def _predict_group(snap: ServingSnapshot, items: list[dict]) -> list[dict]:
+    return predict_batch(df=snap.df, artifact=snap.artifact, items=items, stats=snap.stats, index=snap.index)
+
+
+# Opt-in: with a window of a few milliseconds, concurrent /api/predict calls share one
+# model evaluation. 0 (the default) sends every call straight to the predict lane.
+PREDICT_BATCHER = MicroBatcher(
+    "predict",
+    _predict_group,
+    PREDICT_LANE,
+    window_ms=float(os.environ.get("ROI_PREDICT_BATCH_WINDOW_MS", "0")),
+    max_batch=int(os.environ.get("ROI_PREDICT_BATCH_MAX", "64")),
+)
 
-app = FastAPI(title="ROI Suburb Finder API")
+REPORT_CACHE = ReportCache()
+# Filter presets rendered ahead of time so their exports are served straight from cache.
+REPORT_PRESETS: list[ReportFilters] = [
+    normalize_report_filters(None, None, None, None, 20),
+    normalize_report_filters(None, 10, None, None, 20),
+    normalize_report_filters(None, 10, None, None, 10),
+]
+
+# JSON bodies that only change with the dataset version, encoded once and served with an
+# ETag. Name lists are warmed for the limits the frontend asks for.
+STATIC_BODIES = ReportCache(max_entries=64, max_bytes=16 * 1024 * 1024)
+STATIC_NAME_LIMITS = (200, 500)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Warm-ups run on the lanes in the background; shutdown waits for them so no render is
+    # still in flight when the pools go away.
+    snap = SNAPSHOTS.current
+    warmups = [
+        asyncio.create_task(INSIGHTS_LANE.run(_warm_static_bodies, snap)),
+        asyncio.create_task(REPORT_LANE.run(_warm_reports, snap)),
+    ]
+    SNAPSHOTS.start()
+    yield
+    await asyncio.gather(*warmups, return_exceptions=True)
+    SNAPSHOTS.stop()
+    for lane in LANES:
+        lane.shutdown()
+
+
+app = FastAPI(title="ROI Suburb Finder API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -36,17 +112,49 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Dataset-Version"],
 )
 
-MODEL_ARTIFACT = load_model_artifact()
-DATA_DF = load_dataset(MODEL_ARTIFACT)
-SUBURBS_DATA = dataset_to_api_rows(DATA_DF)
-MODEL_FEATURES = MODEL_ARTIFACT.get("features", []) if MODEL_ARTIFACT else []
 
+@app.exception_handler(LaneSaturated)
+async def lane_saturated(_: Request, exc: LaneSaturated):
+    return JSONResponse(status_code=503, content={"error": str(exc)}, headers={"Retry-After": "1"})
 
 class PredictRequest(BaseModel):
     suburb_name: Optional[str] = None
+    sal_code: Optional[str] = None
+    feature_values: dict[str, float] = Field(default_factory=dict)
+
+
+class PredictBatchRequest(BaseModel):
+    items: list[PredictRequest] = Field(default_factory=list, max_length=5000)
+
+
+class SweepRequest(BaseModel):
+    suburb_name: Optional[str] = None
+    sal_code: Optional[str] = None
+    feature_values: dict[str, float] = Field(default_factory=dict)
+    features: list[str] = Field(min_length=1, max_length=2)
+    points: int = 25
+    ranges: dict[str, tuple[float, float]] = Field(default_factory=dict)
+
+
+class GoalSeekRequest(BaseModel):
+    suburb_name: Optional[str] = None
+    sal_code: Optional[str] = None
     feature_values: dict[str, float] = Field(default_factory=dict)
+    target_roi: float
+    features: list[str] = Field(default_factory=list)
+    time_budget_ms: float = GOAL_SEEK_BUDGET_MS
+
+
+class ScoreRequest(BaseModel):
+    preset: Optional[str] = None
+    weights: dict[str, float] = Field(default_factory=dict)
+    top_n: int = 20
+    min_roi: Optional[float] = None
+    max_price: Optional[float] = None
+    min_seifa: Optional[float] = None
 
 
 @app.get("/")
@@ -56,46 +164,149 @@ async def root():
 
 @app.get("/api/health")
 async def health():
+    snap = SNAPSHOTS.current
     return {
         "status": "ok",
-        "suburbs_loaded": len(SUBURBS_DATA),
-        "model_loaded": MODEL_ARTIFACT is not None,
-        "model_features": len(MODEL_FEATURES),
+        "suburbs_loaded": len(snap.suburbs),
+        "model_loaded": snap.artifact is not None,
+        "model_features": len(snap.model_features),
+        "version": snap.version,
+        "loaded_at": snap.loaded_at,
+        "reload_error": SNAPSHOTS.last_error,
+        "executors": {lane.name: lane.stats() for lane in LANES},
+        "predict_batching": PREDICT_BATCHER.stats(),
+        "report_cache": REPORT_CACHE.stats(),
+        "static_bodies": STATIC_BODIES.stats(),
     }
 
 
-@app.get("/api/features")
-async def features():
-    if MODEL_ARTIFACT is None:
+def _features_payload(snap: ServingSnapshot) -> dict:
+    if snap.artifact is None:
         return {"features": [], "message": "Model not loaded."}
-    return {"features": get_feature_metadata(DATA_DF, MODEL_FEATURES)}
+    return {"features": get_feature_metadata(snap.df, snap.model_features)}
 
 
-@app.get("/api/input-guidance")
-async def input_guidance():
-    return {"guidance": user_input_guidance(DATA_DF)}
+def _guidance_payload(snap: ServingSnapshot) -> dict:
+    return {"guidance": user_input_guidance(snap.df)}
 
 
-@app.get("/api/model-info")
-async def model_info():
-    if MODEL_ARTIFACT is None:
+def _model_info_payload(snap: ServingSnapshot) -> dict:
+    if snap.artifact is None:
         return {
             "model_loaded": False,
             "target": None,
             "feature_count": 0,
             "metrics": {},
+            "version": snap.version,
         }
     return {
         "model_loaded": True,
-        "target": MODEL_ARTIFACT.get("target"),
-        "feature_count": len(MODEL_FEATURES),
-        "metrics": MODEL_ARTIFACT.get("metrics", {}),
+        "target": snap.artifact.get("target"),
+        "feature_count": len(snap.model_features),
+        "metrics": snap.artifact.get("metrics", {}),
+        "version": snap.version,
     }
 
 
+def _names_payload(snap: ServingSnapshot, limit: int) -> dict:
+    return {"names": suburb_names(snap.names, q=None, limit=limit)}
+
+
+def _bootstrap_payload(snap: ServingSnapshot) -> dict:
+    # Everything the frontend loads on mount, in one document.
+    return {
+        "version": snap.version,
+        "features": _features_payload(snap)["features"],
+        "names": _names_payload(snap, STATIC_NAME_LIMITS[-1])["names"],
+        "guidance": _guidance_payload(snap)["guidance"],
+        "model_info": _model_info_payload(snap),
+    }
+
+
+def _frontier_payload(snap: ServingSnapshot, objectives: str, layers: int) -> dict:
+    return pareto_frontier(snap.df, snap.suburbs, tuple(objectives.split("+")), layers)
+
+
+STATIC_PAYLOADS: dict[str, Callable[..., dict]] = {
+    "frontier": _frontier_payload,
+    "bootstrap": _bootstrap_payload,
+    "features": _features_payload,
+    "input-guidance": _guidance_payload,
+    "model-info": _model_info_payload,
+    "suburb-names": _names_payload,
+}
+
+
+def _static_body(snap: ServingSnapshot, kind: str, *args: Any, encoding: str = "identity") -> bytes:
+    key = (kind, snap.version, encoding) + args
+    body = STATIC_BODIES.get(key)
+    if body is None:
+        if encoding == "identity":
+            body = encode_json(STATIC_PAYLOADS[kind](snap, *args))
+        else:
+            body = COMPRESSORS[encoding](_static_body(snap, kind, *args))
+        STATIC_BODIES.put(key, body)
+    return body
+
+
+async def _static_response(request: Request, kind: str, *args: Any, compress: bool = False) -> Response:
+    snap = SNAPSHOTS.current
+    encoding = negotiate_encoding(request.headers.get("accept-encoding")) if compress else "identity"
+    etag_key = (kind, *args) if encoding == "identity" else (kind, *args, encoding)
+    headers = {"ETag": static_etag(snap.version, *etag_key), "Cache-Control": "no-cache"}
+    if compress:
+        headers["Vary"] = "Accept-Encoding"
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    if (kind, snap.version, encoding) + args in STATIC_BODIES:
+        body = _static_body(snap, kind, *args, encoding=encoding)
+    else:
+        body = await INSIGHTS_LANE.run(_static_body, snap, kind, *args, encoding=encoding)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _warm_static_bodies(snap: ServingSnapshot) -> None:
+    STATIC_BODIES.retain_version(snap.version)
+    for kind in ("features", "input-guidance", "model-info"):
+        _static_body(snap, kind)
+    for limit in STATIC_NAME_LIMITS:
+        _static_body(snap, "suburb-names", limit)
+    for encoding in ("identity", *COMPRESSORS):
+        _static_body(snap, "bootstrap", encoding=encoding)
+    _static_body(snap, "frontier", "+".join(DEFAULT_OBJECTIVES), 1)
+
+
+SNAPSHOTS.subscribe(_warm_static_bodies)
+
+
+@app.get("/api/bootstrap")
+async def bootstrap(request: Request):
+    return await _static_response(request, "bootstrap", compress=True)
+
+
+@app.get("/api/features")
+async def features(request: Request):
+    return await _static_response(request, "features")
+
+
+@app.get("/api/input-guidance")
+async def input_guidance(request: Request):
+    return await _static_response(request, "input-guidance")
+
+
+@app.get("/api/model-info")
+async def model_info(request: Request):
+    return await _static_response(request, "model-info")
+
+
 @app.get("/api/suburb-names")
-async def get_suburb_names(q: Optional[str] = None, limit: int = 200):
-    return {"names": suburb_names(DATA_DF, q=q, limit=limit)}
+async def get_suburb_names(request: Request, q: Optional[str] = None, limit: int = 200):
+    if not q:
+        return await _static_response(request, "suburb-names", max(1, min(limit, 1000)))
+    return {"names": suburb_names(SNAPSHOTS.current.names, q=q, limit=limit)}
 
 
 @app.get("/api/suburbs")
@@ -105,21 +316,41 @@ async def get_suburbs(
     max_price: Optional[float] = None,
     min_seifa: Optional[float] = None,
     top_n: int = 100,
+    sort_by: Literal["roi", "price", "rent", "seifa_score", "yield_pct", "growth_pct"] = "roi",
+    order: Literal["desc", "asc"] = "desc",
+    cursor: Optional[str] = None,
+    min_roi_p10: Optional[float] = None,
 ):
-    filtered_data = filter_suburbs(
-        SUBURBS_DATA,
-        name=name,
-        min_roi=min_roi,
-        max_price=max_price,
-        min_seifa=min_seifa,
-    )
-    top_n = max(1, min(top_n, 500))
-    return filtered_data[:top_n]
+    snap = SNAPSHOTS.current
+    try:
+        rows, next_cursor = suburb_page(
+            snap.suburbs,
+            snap.version,
+            cursor=cursor,
+            name=name,
+            min_roi=min_roi,
+            max_price=max_price,
+            min_seifa=min_seifa,
+            limit=max(1, min(top_n, 500)),
+            sort_by=sort_by,
+            descending=order == "desc",
+            min_roi_p10=min_roi_p10,
+        )
+    except StaleCursor as exc:
+        return JSONResponse(status_code=409, content={"error": str(exc)})
+    except InvalidCursor as exc:
+        return JSONResponse(status_code=400, content={"error": str(exc)})
+
+    headers = {"X-Dataset-Version": snap.version}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return JSONResponse(content=rows, headers=headers)
 
 
 @app.get("/api/opportunities")
 async def opportunities(top_n: int = 20):
-    return investment_opportunities(DATA_DF, top_n=top_n)
+    snap = SNAPSHOTS.current
+    return await INSIGHTS_LANE.run(investment_opportunities, snap.df, top_n=top_n, columns=snap.insights)
 
 
 @app.get("/api/suburbs-near-roi")
@@ -128,55 +359,121 @@ async def opportunities(top_n: int = 20):
 async def suburbs_near_roi(roi: float, top_n: int = 5):
     return {
         "target_roi": roi,
-        "suburbs": suburbs_closest_to_roi(SUBURBS_DATA, target_roi=roi, top_n=top_n),
+        "suburbs": suburbs_closest_to_roi(SNAPSHOTS.current.suburbs, target_roi=roi, top_n=top_n),
     }
 
 
+@app.get("/api/suburbs/{code}/similar")
+async def get_similar_suburbs(
+    code: str,
+    k: int = 10,
+    min_roi: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_seifa: Optional[float] = None,
+):
+    snap = SNAPSHOTS.current
+    row = snap.index.by_code.get(code.strip())
+    if row is None or row not in snap.similarity:
+        return JSONResponse(status_code=404, content={"error": f"Unknown SAL code: {code}"})
+    return similar_suburbs(
+        snap.suburbs,
+        snap.similarity,
+        row,
+        k=k,
+        min_roi=min_roi,
+        max_price=max_price,
+        min_seifa=min_seifa,
+    )
+
+
+@app.get("/api/frontier")
+async def frontier(request: Request, objectives: str = ",".join(DEFAULT_OBJECTIVES), layers: int = 1):
+    try:
+        chosen = normalize_objectives(objectives.split(","))
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"error": str(exc)})
+    # Cached with the other per-version bodies, keyed on the canonical objective set.
+    return await _static_response(request, "frontier", "+".join(chosen), max(1, min(layers, MAX_LAYERS)))
+
+
+@app.get("/api/score/components")
+async def score_components():
+    return {"components": SNAPSHOTS.current.scores.components, "presets": SCORE_PRESETS}
+
+
+@app.post("/api/score")
+async def score(payload: ScoreRequest):
+    snap = SNAPSHOTS.current
+    if payload.preset is not None and payload.preset not in SCORE_PRESETS:
+        return JSONResponse(status_code=400, content={"error": f"Unknown preset: {payload.preset}"})
+    invalid = sorted(k for k, w in payload.weights.items() if not abs(w) <= MAX_WEIGHT)
+    if invalid:
+        return JSONResponse(
+            status_code=422,
+            content={"error": f"Weights must be finite and at most {MAX_WEIGHT:g} in size: {', '.join(invalid)}."},
+        )
+    # Explicit weights override the preset's.
+    weights = {**SCORE_PRESETS.get(payload.preset, {}), **payload.weights}
+    try:
+        return score_suburbs(
+            snap.suburbs,
+            snap.scores,
+            weights,
+            top_n=payload.top_n,
+            min_roi=payload.min_roi,
+            max_price=payload.max_price,
+            min_seifa=payload.min_seifa,
+        )
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"error": str(exc)})
+
+
+def _report_insights(snap: ServingSnapshot, filters: ReportFilters) -> dict:
+    name, min_roi, max_price, min_seifa, top_n = filters
+    indices = snap.suburbs.filter_indices(name=name, min_roi=min_roi, max_price=max_price, min_seifa=min_seifa)
+    filtered = any(value is not None for value in filters[:4])
+    return opportunities_from_indices(snap.report_insights, indices, top_n=top_n, filtered=filtered)
+
+
 def _format_filters(
     name: Optional[str],
     min_roi: Optional[float],
     max_price: Optional[float],
     min_seifa: Optional[float],
     top_n: int,
+    applied_top_n: int,
 ) -> dict[str, str]:
+    # The filters as the request sent them; the normalized ones only pick the rows.
     return {
-        "Suburb Name Filter": name or "Any",
+        "Suburb Name Filter": name.strip() if name and name.strip() else "Any",
         "Min ROI (%)": str(min_roi) if min_roi is not None else "Any",
         "Max Mortgage Proxy": str(max_price) if max_price is not None else "Any",
         "Min SEIFA": str(min_seifa) if min_seifa is not None else "Any",
-        "Top N": str(top_n),
+        "Top N": str(top_n) if top_n == applied_top_n else f"{top_n} (showing {applied_top_n})",
     }
 
 
-@app.get("/api/report/csv")
-async def download_report_csv(
-    name: Optional[str] = None,
-    min_roi: Optional[float] = None,
-    max_price: Optional[float] = None,
-    min_seifa: Optional[float] = None,
-    top_n: int = 20,
-):
-    filtered = filter_suburbs(
-        SUBURBS_DATA,
-        name=name,
-        min_roi=min_roi,
-        max_price=max_price,
-        min_seifa=min_seifa,
-    )
-    insights = opportunities_from_rows(filtered, top_n=top_n)
-    summary = insights["summary"]
-    opportunities = insights["opportunities"]
-    filters = _format_filters(name, min_roi, max_price, min_seifa, top_n)
-
+def _csv_report_header(shown: dict[str, str]) -> bytes:
+    # Written per download in front of the cached data sections.
     output = StringIO()
     writer = csv.writer(output)
     writer.writerow(["Report Generated At", datetime.utcnow().isoformat() + "Z"])
     writer.writerow([])
     writer.writerow(["Current Filters"])
     writer.writerow(["Filter", "Value"])
-    for k, v in filters.items():
+    for k, v in shown.items():
         writer.writerow([k, v])
     writer.writerow([])
+    return output.getvalue().encode("utf-8")
+
+
+def _render_csv_report(snap: ServingSnapshot, filters: ReportFilters) -> str:
+    insights = _report_insights(snap, filters)
+    summary = insights["summary"]
+    opportunities = insights["opportunities"]
+
+    output = StringIO()
+    writer = csv.writer(output)
     writer.writerow(["Summary Metrics"])
     writer.writerow(["Metric", "Value"])
     for k, v in summary.items():
@@ -196,33 +493,32 @@ async def download_report_csv(
             ]
         )
 
-    filename = f"suburb_recommendation_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
-    )
+    return output.getvalue()
 
 
-@app.get("/api/report/pdf")
-async def download_report_pdf(
+@app.get("/api/report/csv")
+async def download_report_csv(
     name: Optional[str] = None,
     min_roi: Optional[float] = None,
     max_price: Optional[float] = None,
     min_seifa: Optional[float] = None,
     top_n: int = 20,
 ):
-    filtered = filter_suburbs(
-        SUBURBS_DATA,
-        name=name,
-        min_roi=min_roi,
-        max_price=max_price,
-        min_seifa=min_seifa,
+    filters = normalize_report_filters(name, min_roi, max_price, min_seifa, top_n)
+    shown = _format_filters(name, min_roi, max_price, min_seifa, top_n, filters[-1])
+    body = _csv_report_header(shown) + await _report_body("csv", SNAPSHOTS.current, filters, shown)
+    filename = f"suburb_recommendation_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+    return StreamingResponse(
+        iter([body]),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}", "ETag": body_etag(body)},
     )
-    insights = opportunities_from_rows(filtered, top_n=top_n)
+
+
+def _render_pdf_report(snap: ServingSnapshot, filters: ReportFilters, shown: dict[str, str]) -> bytes:
+    insights = _report_insights(snap, filters)
     summary = insights["summary"]
     opportunities = insights["opportunities"]
-    filters = _format_filters(name, min_roi, max_price, min_seifa, top_n)
 
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), leftMargin=24, rightMargin=24, topMargin=24, bottomMargin=24)
@@ -230,10 +526,11 @@ async def download_report_pdf(
     story = []
 
     story.append(Paragraph("Suburb Recommendation Report", styles["Title"]))
+    # Cached PDFs keep the time they were rendered, not the time of each download.
     story.append(Paragraph(f"Generated: {datetime.utcnow().isoformat()}Z", styles["Normal"]))
     story.append(Spacer(1, 10))
 
-    filter_rows = [["Filter", "Value"]] + [[k, v] for k, v in filters.items()]
+    filter_rows = [["Filter", "Value"]] + [[k, v] for k, v in shown.items()]
     filter_table = Table(filter_rows, colWidths=[220, 420])
     filter_table.setStyle(
         TableStyle(
@@ -294,26 +591,167 @@ async def download_report_pdf(
     story.append(opp_table)
 
     doc.build(story)
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+@app.get("/api/report/pdf")
+async def download_report_pdf(
+    name: Optional[str] = None,
+    min_roi: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_seifa: Optional[float] = None,
+    top_n: int = 20,
+):
+    filters = normalize_report_filters(name, min_roi, max_price, min_seifa, top_n)
+    shown = _format_filters(name, min_roi, max_price, min_seifa, top_n, filters[-1])
+    body = await _report_body("pdf", SNAPSHOTS.current, filters, shown)
     filename = f"suburb_recommendation_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.pdf"
     return StreamingResponse(
-        buffer,
+        iter([body]),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers={"Content-Disposition": f"attachment; filename={filename}", "ETag": body_etag(body)},
     )
 
 
+@app.get("/api/export/csv")
+async def export_csv(
+    name: Optional[str] = None,
+    min_roi: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_seifa: Optional[float] = None,
+    gzip: bool = False,
+):
+    snap = SNAPSHOTS.current
+    indices = snap.suburbs.filter_indices(name=name, min_roi=min_roi, max_price=max_price, min_seifa=min_seifa)
+    body = iter_csv_export(snap.df, indices, export_columns(snap.df, snap.model_features), compress=gzip)
+
+    filename = f"suburb_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+    if gzip:
+        filename += ".gz"
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}", "X-Dataset-Version": snap.version},
+    )
+
+
+def _report_key(kind: str, snap: ServingSnapshot, filters: ReportFilters, shown: dict[str, str]) -> tuple:
+    # Cached CSV bodies hold only the data sections, so the normalized filters key them. The
+    # PDF prints the filters as sent, so those are part of its key.
+    key = (kind, snap.version) + filters
+    return key + tuple(shown.values()) if kind == "pdf" else key
+
+
+def _render_report(kind: str, snap: ServingSnapshot, filters: ReportFilters, shown: dict[str, str]) -> bytes:
+    if kind == "csv":
+        body = _render_csv_report(snap, filters).encode("utf-8")
+    else:
+        body = _render_pdf_report(snap, filters, shown)
+    REPORT_CACHE.put(_report_key(kind, snap, filters, shown), body)
+    return body
+
+
+async def _report_body(kind: str, snap: ServingSnapshot, filters: ReportFilters, shown: dict[str, str]) -> bytes:
+    body = REPORT_CACHE.get(_report_key(kind, snap, filters, shown))
+    if body is not None:
+        return body
+    return await REPORT_LANE.run(_render_report, kind, snap, filters, shown)
+
+
+def _warm_reports(snap: ServingSnapshot) -> None:
+    REPORT_CACHE.retain_version(snap.version)
+    for filters in REPORT_PRESETS:
+        shown = _format_filters(*filters, filters[-1])
+        for kind in ("csv", "pdf"):
+            if _report_key(kind, snap, filters, shown) not in REPORT_CACHE:
+                _render_report(kind, snap, filters, shown)
+
+
+SNAPSHOTS.subscribe(_warm_reports)
+
+
 @app.post("/api/predict")
 async def predict(payload: PredictRequest):
-    if MODEL_ARTIFACT is None:
+    snap = SNAPSHOTS.current
+    if snap.artifact is None:
         return {"error": "Model is not loaded. Run model_training.py first."}
 
-    return predict_from_inputs(
-        df=DATA_DF,
-        artifact=MODEL_ARTIFACT,
+    if PREDICT_BATCHER.enabled:
+        return await PREDICT_BATCHER.submit(snap, payload.model_dump())
+
+    return await PREDICT_LANE.run(
+        predict_from_inputs,
+        df=snap.df,
+        artifact=snap.artifact,
         suburb_name=payload.suburb_name,
         feature_values=payload.feature_values,
+        stats=snap.stats,
+        index=snap.index,
+        sal_code=payload.sal_code,
+    )
+
+
+@app.post("/api/predict/batch")
+async def predict_many(payload: PredictBatchRequest):
+    snap = SNAPSHOTS.current
+    if snap.artifact is None:
+        return {"error": "Model is not loaded. Run model_training.py first."}
+
+    predictions = await PREDICT_LANE.run(
+        predict_batch,
+        df=snap.df,
+        artifact=snap.artifact,
+        items=[item.model_dump() for item in payload.items],
+        stats=snap.stats,
+        index=snap.index,
     )
+    return {"count": len(predictions), "predictions": predictions}
+
+
+@app.post("/api/predict/sweep")
+async def sweep(payload: SweepRequest):
+    snap = SNAPSHOTS.current
+    if snap.artifact is None:
+        return {"error": "Model is not loaded. Run model_training.py first."}
+
+    try:
+        return await PREDICT_LANE.run(
+            predict_sweep,
+            artifact=snap.artifact,
+            stats=snap.stats,
+            index=snap.index,
+            features=payload.features,
+            suburb_name=payload.suburb_name,
+            sal_code=payload.sal_code,
+            feature_values=payload.feature_values,
+            points=payload.points,
+            ranges=payload.ranges,
+        )
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"error": str(exc)})
+
+
+@app.post("/api/predict/goal-seek")
+async def seek(payload: GoalSeekRequest):
+    snap = SNAPSHOTS.current
+    if snap.artifact is None:
+        return {"error": "Model is not loaded. Run model_training.py first."}
+
+    try:
+        return await GOAL_SEEK_LANE.run(
+            goal_seek,
+            artifact=snap.artifact,
+            stats=snap.stats,
+            index=snap.index,
+            target_roi=payload.target_roi,
+            features=payload.features,
+            suburb_name=payload.suburb_name,
+            sal_code=payload.sal_code,
+            feature_values=payload.feature_values,
+            time_budget_ms=payload.time_budget_ms,
+        )
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"error": str(exc)})
 
 
 if __name__ == "__main__":
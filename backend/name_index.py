@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+
+MAX_GRAM = 3
+MAX_TYPOS = 2
+# Occurrences of each character tracked per name for the typo filter.
+CHAR_OCCURRENCES = 3
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+def _grams(text: str, n: int) -> set[str]:
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def _typo_budget(query: str) -> int:
+    # Two typos in a short query match a large share of the dataset.
+    if len(query) < 3:
+        return 0
+    return 1 if len(query) < 6 else MAX_TYPOS
+
+
+# Lookup structure over the distinct suburb names. Every 1-, 2- and 3-gram of the
+# lowercased names maps to the sorted ids of the names containing it, so a substring
+# query intersects a few posting lists and only verifies the survivors. Typo-tolerant
+# matching runs a Levenshtein DP against name prefixes, vectorized over the candidates
+# that share enough bigrams and characters with the query to possibly be within the typo
+# budget. Rows without a name (None) get the label id len(labels), which never matches.
+class NameIndex:
+    def __init__(self, names: Iterable[str | None]):
+        values = list(names)
+        present = np.array([v is not None for v in values], dtype=bool)
+        labels, inverse = np.unique(np.asarray([v for v in values if v is not None], dtype=str), return_inverse=True)
+        self.labels: list[str] = labels.tolist()
+        self.row_label = np.full(len(values), len(self.labels), dtype=np.intp)
+        self.row_label[present] = inverse.reshape(-1)
+        self.keys = [label.lower() for label in self.labels]
+
+        postings: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            for n in range(1, MAX_GRAM + 1):
+                for gram in _grams(key, n):
+                    postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+        self._key_order = np.argsort(np.asarray(self.keys, dtype=str), kind="stable")
+        self._sorted_keys = np.asarray(self.keys, dtype=str)[self._key_order]
+
+        width = max((len(key) for key in self.keys), default=0)
+        self._lengths = np.array([len(key) for key in self.keys], dtype=np.intp)
+        self._codes = np.full((len(self.keys), width), -1, dtype=np.int32)
+        for i, key in enumerate(self.keys):
+            self._codes[i, : len(key)] = [ord(c) for c in key]
+
+        # Positions of each character's first few occurrences in every name (255 when
+        # absent), so the typo filter counts query characters inside a name prefix with a
+        # comparison instead of a scan over the names.
+        rows, cols = np.nonzero(self._codes >= 0)
+        alphabet, code_ids = np.unique(self._codes[rows, cols], return_inverse=True)
+        order = np.lexsort((cols, rows, code_ids))
+        rows, cols, code_ids = rows[order], cols[order], code_ids[order]
+        step = np.arange(len(rows))
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = (code_ids[1:] != code_ids[:-1]) | (rows[1:] != rows[:-1])
+        rank = step - np.maximum.accumulate(np.where(first, step, 0))
+        keep = rank < CHAR_OCCURRENCES
+        # Laid out (occurrence, name) so each comparison reads a contiguous row.
+        table = np.full((len(alphabet), CHAR_OCCURRENCES, len(self.keys)), 255, dtype=np.uint8)
+        table[code_ids[keep], rank[keep], rows[keep]] = np.minimum(cols[keep], 255)
+        self._occurrences = {int(code): table[i] for i, code in enumerate(alphabet.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def _posting(self, gram: str) -> np.ndarray:
+        return self._postings.get(gram, _EMPTY)
+
+    def containing(self, query: str) -> np.ndarray:
+        # Ids of the names containing `query` (case-insensitive), in label order.
+        query = query.lower()
+        if not query:
+            return np.arange(len(self.labels), dtype=np.int32)
+        if len(query) <= MAX_GRAM:
+            return self._posting(query)
+
+        lists = sorted((self._posting(g) for g in _grams(query, MAX_GRAM)), key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            if len(candidates) <= 32:
+                break
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        return np.array([i for i in candidates.tolist() if query in self.keys[i]], dtype=np.int32)
+
+    def label_mask(self, query: str) -> np.ndarray:
+        # One slot per label plus the always-False slot of rows without a name.
+        hits = np.zeros(len(self.labels) + 1, dtype=bool)
+        hits[self.containing(query)] = True
+        return hits
+
+    def _prefixed(self, query: str) -> np.ndarray:
+        lo = np.searchsorted(self._sorted_keys, query, side="left")
+        hi = np.searchsorted(self._sorted_keys, query + "\U0010ffff", side="left")
+        return np.sort(self._key_order[lo:hi])
+
+    def _typo_matches(self, query: str, budget: int, exclude: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Each edit breaks at most two of the query's bigrams, so a name within `budget`
+        # edits of the query still contains all but 2 * budget of them; that bound only
+        # exists for longer queries. Every query character an edit does not touch is
+        # matched inside the name prefix compared against, which is at most
+        # len(query) + budget long, so that prefix must also hold all but `budget` of the
+        # query's characters (counted with multiplicity). That bound always applies.
+        m = len(query)
+        width = min(m + budget, self._codes.shape[1])
+        candidates = self._lengths >= m - budget
+        bigrams = _grams(query, 2)
+        needed = len(bigrams) - 2 * budget
+        if needed > 0:
+            counts = np.zeros(len(self.labels), dtype=np.intp)
+            for gram in bigrams:
+                counts[self._posting(gram)] += 1
+            candidates &= counts >= needed
+        candidates[exclude] = False
+        # After the bigram filter only a few names are left to gather; otherwise compare
+        # whole rows of the occurrence table.
+        ids = np.flatnonzero(candidates) if needed > 0 else slice(None)
+
+        # Past CHAR_OCCURRENCES a repeated character is assumed present whenever all its
+        # tracked occurrences are, which only loosens the bound.
+        shared = np.zeros(len(self.labels) if needed <= 0 else len(ids), dtype=np.intp)
+        for ch, count in Counter(query).items():
+            positions = self._occurrences.get(ord(ch))
+            if positions is None:
+                continue
+            tracked = min(count, CHAR_OCCURRENCES)
+            inside = (positions[:tracked, ids] < width).sum(axis=0)
+            if count > tracked:
+                inside += np.where(inside == tracked, count - tracked, 0)
+            shared += inside
+        if needed > 0:
+            candidates = ids[shared >= m - budget]
+        else:
+            candidates = np.flatnonzero(candidates & (shared >= m - budget))
+        if not len(candidates):
+            return candidates, candidates
+
+        sub = self._codes[candidates, :width]
+        offsets = np.arange(width + 1, dtype=np.int16)
+        prev = np.tile(offsets, (len(candidates), 1))
+        for i, ch in enumerate(query, 1):
+            cost = sub != ord(ch)
+            cur = np.empty_like(prev)
+            cur[:, 0] = i
+            cur[:, 1:] = np.minimum(prev[:, 1:] + 1, prev[:, :-1] + cost)
+            # Insertions along the row: cur[j] = min over k <= j of cur[k] + (j - k).
+            prev = np.minimum.accumulate(cur - offsets, axis=1) + offsets
+
+        # Distance from the query to the closest prefix of each name, whole name included.
+        columns = np.arange(width + 1)
+        valid = (columns >= m - budget) & (columns[None, :] <= self._lengths[candidates, None])
+        distance = np.where(valid, prev, budget + 1).min(axis=1)
+        keep = distance <= budget
+        return candidates[keep], distance[keep]
+
+    def search(self, query: str, limit: int) -> list[str]:
+        # Ranked: names starting with the query, then names containing it, then names
+        # whose prefix is within the typo budget (closest first). Ties go by name.
+        query = query.lower()
+        prefixed = self._prefixed(query)
+        ranked = [prefixed]
+        found = len(prefixed)
+        if found < limit:
+            inner = np.setdiff1d(self.containing(query), prefixed, assume_unique=True)
+            ranked.append(inner)
+            found += len(inner)
+        budget = _typo_budget(query)
+        if found < limit and budget:
+            matched = np.concatenate(ranked).astype(np.intp)
+            ids, distance = self._typo_matches(query, budget, matched)
+            ranked.append(ids[np.lexsort((ids, distance))])
+
+        ids = np.concatenate(ranked)[:limit].tolist()
+        return [self.labels[i] for i in ids]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import base64
+import json
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class StaleCursor(InvalidCursor):
+    pass
+
+
+# Cursors are opaque to clients: base64url JSON holding the dataset version and the
+# (roi, SAL code) key of the last row served.
+def encode_cursor(version: str, roi: float, code: str) -> str:
+    raw = json.dumps({"v": version, "r": roi, "k": code}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, version: str) -> tuple[float, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        cursor_version, roi, code = payload["v"], float(payload["r"]), str(payload["k"])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid pagination cursor.") from None
+    if cursor_version != version:
+        raise StaleCursor("The dataset changed since this cursor was issued; restart from the first page.")
+    return roi, code
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import threading
+from typing import Any, Hashable, Optional
+
+ReportFilters = tuple[Optional[str], Optional[float], Optional[float], Optional[float], int]
+
+
+def normalize_report_filters(
+    name: str | None,
+    min_roi: float | None,
+    max_price: float | None,
+    min_seifa: float | None,
+    top_n: int,
+) -> ReportFilters:
+    # Cache key only: the name filter is a case-insensitive substring match and top_n is
+    # clamped by opportunities_from_rows, so requests that only differ there select the same
+    # rows. Reports display the filters as sent.
+    name = name.strip().lower() if name and name.strip() else None
+    return (
+        name,
+        None if min_roi is None else float(min_roi),
+        None if max_price is None else float(max_price),
+        None if min_seifa is None else float(min_seifa),
+        max(5, min(int(top_n), 100)),
+    )
+
+
+def body_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+# Rendered report bodies keyed by (kind, dataset version, normalized filters, ...). Entries are
+# evicted least-recently-used first whenever either the entry count or the total body size
+# goes over its limit. Download filenames and the CSV header carry the request time and are not
+# cached.
+class ReportCache:
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Hashable) -> bytes | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def retain_version(self, version: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if isinstance(k, tuple) and k[1] != version]:
+                self._bytes -= len(self._entries.pop(key))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
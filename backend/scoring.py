@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+# Columns besides the model features that make sense as score components.
+EXTRA_COMPONENTS = [
+    "Median_mortgage_repay_monthly",
+    "Median_rent_weekly",
+    "Income_to_Mortgage_Ratio",
+    "Estimated_Property_Price",
+    "Estimated_Gross_Yield_Pct",
+    "roi",
+]
+LOG_POPULATION = "Log_Population"
+# Components are in [0, 1], so weights up to this size keep every score finite.
+MAX_WEIGHT = 1e6
+
+# Weightings from data_preparation.py. A negative weight on a component ranks the same as
+# the pipeline's `1 - safe_norm(...)` terms, which only add a constant. These rank close to,
+# but do not reproduce, ROI_Proxy_Score and Realistic_ROI_Target: the pipeline normalizes
+# the raw prepared columns (where infinite ratios flatten a component) and leaves rows with
+# a missing component unscored, while here the served values are normalized over named
+# suburbs and missing values contribute nothing.
+PRESETS: dict[str, dict[str, float]] = {
+    "roi_proxy": {
+        "Income_to_Mortgage_Ratio": 0.35,
+        "Median_rent_weekly": 0.30,
+        "IRSAD_Score": 0.20,
+        "Working_Age_Share": 0.15,
+    },
+    "realistic_target": {
+        "Estimated_Gross_Yield_Pct": 0.40,
+        "Income_to_Mortgage_Ratio": 0.25,
+        "IRSAD_Score": 0.20,
+        "Working_Age_Share": 0.15 * 0.45,
+        "Diversity_Share": 0.15 * 0.30,
+        LOG_POPULATION: 0.15 * 0.25,
+        "Senior_Share": -0.20 * 0.50,
+        "Rent_to_Income_Ratio": -0.20 * 0.30,
+        "IRSD_Score": 0.20 * 0.20,
+    },
+}
+
+
+def safe_norm(values: np.ndarray) -> np.ndarray:
+    # Same as data_preparation.safe_norm: min-max scaled, all zeros for a constant column.
+    if np.isnan(values).all():
+        return np.zeros_like(values)
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if hi == lo:
+        return np.zeros_like(values)
+    return (values - lo) / (hi - lo)
+
+
+# Every candidate component min-max normalized once, as one (rows, components) matrix, so
+# any weighting is a single matrix-vector product. Missing values contribute nothing.
+# Only rows with a suburb name are scored.
+class ScoreMatrix:
+    def __init__(self, components: list[str], matrix: np.ndarray, rows: np.ndarray):
+        self.components = components
+        self.matrix = matrix
+        self.rows = rows
+        self._column = {name: j for j, name in enumerate(components)}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, model_features: list[str]) -> "ScoreMatrix":
+        rows = np.flatnonzero(df["name"].notna().to_numpy()) if "name" in df.columns else np.arange(len(df))
+        names = [c for c in dict.fromkeys(model_features + EXTRA_COMPONENTS) if c in df.columns]
+        columns = [pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float)[rows] for c in names]
+        if "Tot_P_P" in df.columns:
+            names.append(LOG_POPULATION)
+            population = pd.to_numeric(df["Tot_P_P"], errors="coerce").to_numpy(dtype=float)[rows]
+            columns.append(np.log1p(population))
+
+        matrix = np.empty((len(rows), len(names)), dtype=float)
+        for j, values in enumerate(columns):
+            matrix[:, j] = np.nan_to_num(safe_norm(values), nan=0.0)
+        return cls(names, np.ascontiguousarray(matrix), rows)
+
+    def weight_vector(self, weights: Mapping[str, float]) -> np.ndarray:
+        unknown = sorted(set(weights) - set(self._column))
+        if unknown:
+            raise ValueError(f"Unknown score components: {', '.join(unknown)}.")
+        if not weights:
+            raise ValueError("At least one weight is required.")
+        vector = np.zeros(len(self.components), dtype=float)
+        for name, weight in weights.items():
+            vector[self._column[name]] = weight
+        return vector
+
+    def top(self, weights: Mapping[str, float], k: int, allowed: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        # Dataset rows of the k best scores (ties in dataset order) and those scores.
+        scores = self.matrix @ self.weight_vector(weights)
+        positions = np.arange(len(self.rows)) if allowed is None else np.flatnonzero(allowed)
+        if k < len(positions):
+            kth = np.partition(-scores[positions], k - 1)[k - 1]
+            positions = positions[-scores[positions] <= kth]
+        positions = positions[np.argsort(-scores[positions], kind="stable")][:k]
+        return self.rows[positions], scores[positions]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import threading
+from typing import Any, Callable
+
+import pandas as pd
+
+from data_loader import CSV_PATH, MODEL_PATH, dataset_to_store, load_dataset, load_model_artifact
+from dataset_cache import scored_dataset_key
+from feature_stats import FeatureIndex, FeatureStats, build_feature_stats
+from insights import InsightColumns
+from name_index import NameIndex
+from scoring import ScoreMatrix
+from similarity import SimilarityIndex
+from suburb_store import SuburbStore, frame_name_index
+
+
+# Everything a request needs, built together and never mutated after publication. Handlers
+# read the current snapshot once and use it for the whole request, so a reload that lands
+# mid-request does not mix data from two versions.
+@dataclass(frozen=True)
+class ServingSnapshot:
+    version: str
+    loaded_at: str
+    artifact: dict[str, Any] | None
+    df: pd.DataFrame
+    suburbs: SuburbStore
+    names: NameIndex
+    model_features: list[str]
+    stats: FeatureStats
+    index: FeatureIndex
+    insights: InsightColumns
+    report_insights: InsightColumns
+    similarity: SimilarityIndex
+    scores: ScoreMatrix
+
+
+def build_snapshot() -> ServingSnapshot:
+    artifact = load_model_artifact()
+    df, csv_digest = load_dataset(artifact)
+    model_features = artifact.get("features", []) if artifact else []
+    stats = build_feature_stats(df, model_features)
+    model_digest = artifact.get("digest", "") if artifact else "no-model"
+    # One name index serves both the name filter and /api/suburb-names.
+    names = frame_name_index(df)
+    suburbs = dataset_to_store(df, names)
+    index = FeatureIndex(df, stats)
+    return ServingSnapshot(
+        version=scored_dataset_key(csv_digest, model_digest)[:12],
+        loaded_at=datetime.utcnow().isoformat() + "Z",
+        artifact=artifact,
+        df=df,
+        suburbs=suburbs,
+        names=names,
+        model_features=model_features,
+        stats=stats,
+        index=index,
+        insights=InsightColumns.from_frame(df),
+        report_insights=InsightColumns.from_store(suburbs),
+        similarity=SimilarityIndex.from_frame(df, index, stats),
+        scores=ScoreMatrix.from_frame(df, model_features),
+    )
+
+
+def _source_signature() -> tuple[tuple[int, int], ...]:
+    signature = []
+    for path in (CSV_PATH, MODEL_PATH):
+        try:
+            st = path.stat()
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((0, 0))
+    return tuple(signature)
+
+
+# Holds the active snapshot and swaps in a rebuilt one when the CSV or model artifact
+# changes on disk. A change must be seen on two consecutive polls before rebuilding so a
+# file that is still being written is not picked up half-way.
+class SnapshotManager:
+    def __init__(self, builder: Callable[[], ServingSnapshot] = build_snapshot, interval: float = 10.0):
+        self._builder = builder
+        self._interval = interval
+        self._signature = _source_signature()
+        self._pending: tuple[tuple[int, int], ...] | None = None
+        self._current = builder()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._listeners: list[Callable[[ServingSnapshot], None]] = []
+        self.last_error: str | None = None
+
+    @property
+    def current(self) -> ServingSnapshot:
+        return self._current
+
+    def subscribe(self, listener: Callable[[ServingSnapshot], None]) -> None:
+        self._listeners.append(listener)
+
+    def reload(self) -> bool:
+        with self._lock:
+            signature = _source_signature()
+            try:
+                snapshot = self._builder()
+            except Exception as exc:  # keep serving the previous version
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                return False
+            self._signature = signature
+            self._pending = None
+            self.last_error = None
+            if snapshot.version == self._current.version:
+                # Touched but unchanged content: keep the warm snapshot.
+                return False
+            self._current = snapshot
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+        return True
+
+    def check(self) -> bool:
+        signature = _source_signature()
+        if signature == self._signature:
+            self._pending = None
+            return False
+        if signature != self._pending:
+            self._pending = signature
+            return False
+        return self.reload()
+
+    def start(self) -> None:
+        if self._interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.check()
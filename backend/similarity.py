@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from feature_stats import FeatureIndex, FeatureStats
+
+BRUTE_FORCE_ROWS = 4096
+
+
+# KD-tree over the median-imputed model features, each scaled to unit standard deviation
+# so no single feature (population, income) dominates the distance. Only rows with a name
+# and an ROI score are indexed; tree positions map back to dataset rows through `rows`.
+class SimilarityIndex:
+    def __init__(self, points: np.ndarray, rows: np.ndarray):
+        self.rows = rows
+        self._tree = cKDTree(points) if len(points) else None
+        self._position = {int(row): i for i, row in enumerate(rows.tolist())}
+        self._points = points
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, index: FeatureIndex, stats: FeatureStats) -> "SimilarityIndex":
+        valid = np.ones(len(df), dtype=bool)
+        if "name" in df.columns:
+            valid &= df["name"].notna().to_numpy()
+        if "roi" in df.columns:
+            valid &= pd.to_numeric(df["roi"], errors="coerce").notna().to_numpy()
+        rows = np.flatnonzero(valid)
+
+        scale = np.array([stats.stds[f] for f in index.features], dtype=float)
+        scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+        points = (index.matrix[rows] - index.medians) / scale
+        return cls(np.ascontiguousarray(points), rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, row: int) -> bool:
+        return row in self._position
+
+    def nearest(self, row: int, k: int, allowed: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        # The k closest rows to `row` (itself excluded), optionally only among positions
+        # where `allowed` is set. Closest first.
+        origin = self._position[row]
+        point = self._points[origin]
+        allowed = np.ones(len(self.rows), dtype=bool) if allowed is None else allowed.copy()
+        allowed[origin] = False
+        count = int(allowed.sum())
+        if not count:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=float)
+
+        if count > BRUTE_FORCE_ROWS:
+            # Over-fetch from the tree in proportion to how much the filter rejects.
+            fetch = min(int((k + 1) * len(self.rows) / count * 1.5) + 1, len(self.rows))
+            distance, position = self._tree.query(point, k=fetch)
+            distance, position = np.atleast_1d(distance), np.atleast_1d(position)
+            keep = allowed[position]
+            if keep.sum() >= k or fetch == len(self.rows):
+                return self.rows[position[keep][:k]], distance[keep][:k]
+
+        # Few allowed rows, or a filter that rejects this whole neighbourhood: scan them all.
+        candidates = np.flatnonzero(allowed)
+        distance = np.sqrt(((self._points[candidates] - point) ** 2).sum(axis=1))
+        if len(candidates) > k:
+            top = np.argpartition(distance, k - 1)[:k]
+            candidates, distance = candidates[top], distance[top]
+        order = np.argsort(distance, kind="stable")
+        return self.rows[candidates[order]], distance[order]
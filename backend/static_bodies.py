@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Callable
+
+try:
+    import brotli
+except ImportError:  # optional; without it only gzip is offered
+    brotli = None
+
+
+def encode_json(payload: Any) -> bytes:
+    # Byte-for-byte what JSONResponse would send for the same payload.
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=11)
+
+
+def _gzip(body: bytes) -> bytes:
+    # mtime=0 keeps the output stable for a given body.
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+# Preferred first when the client accepts several.
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    COMPRESSORS = {"br": _brotli, **COMPRESSORS}
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str:
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if params and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    for coding in COMPRESSORS:
+        if coding in accepted or "*" in accepted:
+            return coding
+    return "identity"
+
+
+def static_etag(version: str, *key: Any) -> str:
+    # These bodies are a pure function of the dataset version and the key, so the ETag
+    # can be derived without hashing the body.
+    return '"' + "-".join([version, *(str(part) for part in key)]) + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
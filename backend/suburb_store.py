@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from name_index import NameIndex
+
+API_FIELDS = [
+    "name",
+    "roi",
+    "roi_p10",
+    "roi_p90",
+    "price",
+    "rent",
+    "seifa_score",
+    "yield_pct",
+    "growth_pct",
+    "Top20_Flag",
+]
+
+
+def frame_name_index(df: pd.DataFrame) -> NameIndex:
+    # Rows without a name are kept (as None) so row positions line up with the frame.
+    return NameIndex(str(n) if pd.notna(n) else None for n in df["name"].tolist())
+
+
+def roi_threshold(min_roi: float) -> float:
+    return min_roi / 100 if min_roi > 1 else min_roi
+
+
+# Columnar view of the scored suburbs: one contiguous array per API field. Filters are
+# vectorized boolean masks and only rows that end up in a response become dicts.
+class SuburbStore:
+    def __init__(
+        self,
+        names: np.ndarray,
+        columns: dict[str, np.ndarray],
+        codes: np.ndarray,
+        name_index: NameIndex | None = None,
+    ):
+        self.names = names
+        self.columns = columns
+        self.codes = codes
+        self.fields = ["name"] + list(columns) if names is not None else list(columns)
+        if name_index is None and names is not None:
+            name_index = NameIndex(str(n) for n in names)
+        self.name_index = name_index
+        self._zeros = np.zeros(len(codes), dtype=float)
+
+        # Stable sort keeps dataset order between equal ROI values.
+        roi = self.numeric("roi")
+        self.roi_order = np.argsort(-roi, kind="stable")
+        self._neg_roi_sorted = -roi[self.roi_order]
+        self._roi_ascending = np.argsort(roi, kind="stable")
+        self._roi_sorted = roi[self._roi_ascending].astype(float)
+        self._roi_rank = np.empty(len(roi), dtype=np.intp)
+        self._roi_rank[self.roi_order] = np.arange(len(roi), dtype=np.intp)
+        self._by_code: dict[str, int] = {}
+        for i, code in enumerate(codes.tolist()):
+            if code:
+                self._by_code.setdefault(code, i)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, name_index: NameIndex | None = None) -> "SuburbStore":
+        existing = [c for c in API_FIELDS if c in df.columns]
+        data = df[existing].copy().fillna(0)
+
+        names = data["name"].to_numpy(dtype=object) if "name" in data.columns else None
+        columns = {c: np.ascontiguousarray(data[c].to_numpy()) for c in existing if c != "name"}
+        if "SAL_CODE_2021" in df.columns:
+            codes = df["SAL_CODE_2021"].fillna("").astype(str).to_numpy(dtype=object)
+        else:
+            codes = np.array([""] * len(df), dtype=object)
+        if name_index is None and names is not None:
+            name_index = frame_name_index(df)
+        return cls(names, columns, codes, name_index)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def numeric(self, field: str) -> np.ndarray:
+        col = self.columns.get(field)
+        return self._zeros if col is None else col
+
+    def mask(
+        self,
+        name: str | None = None,
+        min_roi: float | None = None,
+        max_price: float | None = None,
+        min_seifa: float | None = None,
+        indices: np.ndarray | None = None,
+        min_roi_p10: float | None = None,
+    ) -> np.ndarray:
+        def column(values: np.ndarray) -> np.ndarray:
+            return values if indices is None else values[indices]
+
+        keep = np.ones(len(self) if indices is None else len(indices), dtype=bool)
+
+        if name:
+            if self.name_index is None:
+                keep[:] = False
+            else:
+                keep &= self.name_index.label_mask(name)[column(self.name_index.row_label)]
+
+        if min_roi is not None:
+            keep &= column(self.numeric("roi")) >= roi_threshold(min_roi)
+
+        if min_roi_p10 is not None:
+            # Downside filter on the 10th percentile of the per-tree predictions.
+            keep &= column(self.numeric("roi_p10")) >= roi_threshold(min_roi_p10)
+
+        if max_price is not None:
+            keep &= column(self.numeric("price")) <= max_price
+
+        if min_seifa is not None:
+            keep &= column(self.numeric("seifa_score")) >= min_seifa
+
+        return keep
+
+    def filter_indices(
+        self,
+        name: str | None = None,
+        min_roi: float | None = None,
+        max_price: float | None = None,
+        min_seifa: float | None = None,
+        limit: int | None = None,
+        sort_by: str = "roi",
+        descending: bool = True,
+        offset: int = 0,
+        min_roi_p10: float | None = None,
+    ) -> np.ndarray:
+        if sort_by == "roi" and descending:
+            return self._scan_roi_order(name, min_roi, max_price, min_seifa, limit, offset, min_roi_p10)
+        if offset:
+            raise ValueError("Offsets are only supported for the ROI-descending order.")
+
+        idx = np.flatnonzero(
+            self.mask(name=name, min_roi=min_roi, max_price=max_price, min_seifa=min_seifa, min_roi_p10=min_roi_p10)
+        )
+        return self._top_k(idx, self.numeric(sort_by)[idx], limit, descending)
+
+    def _scan_roi_order(
+        self,
+        name: str | None,
+        min_roi: float | None,
+        max_price: float | None,
+        min_seifa: float | None,
+        limit: int | None,
+        offset: int = 0,
+        min_roi_p10: float | None = None,
+    ) -> np.ndarray:
+        order = self.roi_order
+        if min_roi is not None:
+            # Everything at or above the threshold is a prefix of the ROI-descending order.
+            order = order[: np.searchsorted(self._neg_roi_sorted, -roi_threshold(min_roi), side="right")]
+        order = order[offset:]
+        if not (name or max_price is not None or min_seifa is not None or min_roi_p10 is not None):
+            return order if limit is None else order[:limit]
+
+        def matches(rows: np.ndarray) -> np.ndarray:
+            return self.mask(
+                name=name, max_price=max_price, min_seifa=min_seifa, indices=rows, min_roi_p10=min_roi_p10
+            )
+
+        if limit is None:
+            return order[matches(order)]
+
+        # Walk the pre-sorted order in growing chunks and stop once `limit` matches are found.
+        found: list[np.ndarray] = []
+        count = 0
+        start = 0
+        chunk = max(256, limit * 4)
+        while start < len(order) and count < limit:
+            window = order[start : start + chunk]
+            hits = window[matches(window)]
+            found.append(hits)
+            count += len(hits)
+            start += chunk
+            chunk *= 2
+        if not found:
+            return order[:0]
+        return np.concatenate(found)[:limit]
+
+    def roi_key(self, idx: int) -> tuple[float, str]:
+        # Rows without a SAL code (e.g. trailing notes in the CSV) are keyed by position.
+        return float(self.numeric("roi")[idx]), self.codes[idx] or f"#{idx}"
+
+    def position_after(self, roi: float, code: str) -> int | None:
+        if code.startswith("#") and code[1:].isdigit():
+            idx = int(code[1:])
+            idx = idx if idx < len(self) else None
+        else:
+            idx = self._by_code.get(code)
+        if idx is None or float(self.numeric("roi")[idx]) != roi:
+            return None
+        return int(self._roi_rank[idx]) + 1
+
+    def nearest_roi(self, target_roi: float, k: int) -> np.ndarray:
+        values = self._roi_sorted
+        n = len(values)
+        if n == 0 or k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        pos = int(np.searchsorted(values, target_roi))
+        left, right = pos - 1, pos
+        taken = 0
+        # Two-pointer expansion outwards from the insertion point; a tie in distance
+        # goes to the right side, which holds the higher ROI.
+        while taken < k and (left >= 0 or right < n):
+            if right >= n or (left >= 0 and target_roi - values[left] < values[right] - target_roi):
+                left -= 1
+            else:
+                right += 1
+            taken += 1
+
+        # Widen the window to whole runs of equal ROI so dataset order decides ties at its edges.
+        lo = int(np.searchsorted(values, values[left + 1], side="left"))
+        hi = int(np.searchsorted(values, values[right - 1], side="right"))
+        candidates = self._roi_ascending[lo:hi]
+        window = values[lo:hi]
+        order = np.lexsort((candidates, -window, np.abs(window - target_roi)))
+        return candidates[order[:k]]
+
+    @staticmethod
+    def _top_k(idx: np.ndarray, values: np.ndarray, k: int | None, descending: bool) -> np.ndarray:
+        key = -values if descending else values
+        if k is not None and k < len(idx):
+            # Partial selection, keeping every value tied with the k-th so the final stable sort
+            # still breaks ties by dataset order.
+            kth = np.partition(key, k - 1)[k - 1]
+            selected = key <= kth
+            idx, key = idx[selected], key[selected]
+        return idx[np.argsort(key, kind="stable")][:k]
+
+    def to_rows(self, indices: np.ndarray) -> list[dict[str, Any]]:
+        indices = np.asarray(indices, dtype=np.intp)
+        values: list[list[Any]] = []
+        if self.names is not None:
+            values.append(self.names[indices].tolist())
+        values.extend(col[indices].tolist() for col in self.columns.values())
+        return [dict(zip(self.fields, row)) for row in zip(*values)]
@@ -32,26 +32,19 @@ function App() {
     useEffect(() => {
         const load = async () => {
             try {
-                const [featureRes, suburbRes, guidanceRes] = await Promise.all([
-                    fetch(`${API_BASE}/api/features`),
-                    fetch(`${API_BASE}/api/suburb-names?limit=500`),
-                    fetch(`${API_BASE}/api/input-guidance`),
-                ])
+                const bootstrapRes = await fetch(`${API_BASE}/api/bootstrap`)
+                const bootstrapData = await bootstrapRes.json()
 
-                const featureData = await featureRes.json()
-                const suburbData = await suburbRes.json()
-                const guidanceData = await guidanceRes.json()
-
-                const features = featureData.features || []
+                const features = bootstrapData.features || []
                 const defaults = {}
                 features.forEach((f) => {
                     defaults[f.feature] = f.median
                 })
 
-                const g = guidanceData.guidance || {}
+                const g = bootstrapData.guidance || {}
 
                 setModelDefaults(defaults)
-                setSuburbNames(suburbData.names || [])
+                setSuburbNames(bootstrapData.names || [])
                 setGuidance(g)
                 setUserInputs({
                     monthlyMortgage: String(g.monthly_mortgage?.median ?? ''),
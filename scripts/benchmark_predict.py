@@ -0,0 +1,76 @@
+from pathlib import Path
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'backend'))
+
+import main  # noqa: E402
+
+REQUESTS = 200
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def run(label: str, payloads: list[main.PredictRequest]) -> list[float]:
+    timings = []
+    for payload in payloads:
+        start = time.perf_counter()
+        asyncio.run(main.predict(payload))
+        timings.append((time.perf_counter() - start) * 1000)
+    print(
+        f'{label:>8}: p50={percentile(timings, 50):.2f}ms '
+        f'p99={percentile(timings, 99):.2f}ms mean={statistics.mean(timings):.2f}ms'
+    )
+    return timings
+
+
+def main_benchmark() -> None:
+    snap = main.SNAPSHOTS.current
+    if snap.artifact is None:
+        raise SystemExit('Model is not loaded. Run model_training.py first.')
+
+    names = snap.df['name'].dropna().astype(str).tolist()
+    rng = random.Random(42)
+    payloads = [
+        main.PredictRequest(
+            suburb_name=rng.choice(names),
+            feature_values={'Median_tot_hhd_inc_weekly': rng.randint(800, 4000)},
+        )
+        for _ in range(REQUESTS)
+    ]
+
+    packed = snap.artifact.get('packed_forest')
+    if packed is None:
+        raise SystemExit('Packed forest is disabled (ROI_FOREST_ENGINE=sklearn).')
+
+    def scores() -> list[float]:
+        return [asyncio.run(main.predict(p))['predicted_roi_score'] for p in payloads[:20]]
+
+    packed_results = scores()
+    # The sklearn run also drops the per-tree pass (intervals, path contributions) so it
+    # times model.predict alone; compare the point predictions only.
+    trees = snap.artifact.get('forest_trees')
+    snap.artifact['packed_forest'] = None
+    snap.artifact['forest_trees'] = None
+    try:
+        print('Identical predictions:', packed_results == scores())
+        sklearn_timings = run('sklearn', payloads)
+    finally:
+        snap.artifact['packed_forest'] = packed
+        snap.artifact['forest_trees'] = trees
+    packed_timings = run('packed', payloads)
+
+    speedup = percentile(sklearn_timings, 50) / percentile(packed_timings, 50)
+    print(f'p50 speedup: {speedup:.1f}x')
+
+
+if __name__ == '__main__':
+    main_benchmark()